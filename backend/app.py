@@ -17,17 +17,43 @@
 
 
 
-from flask import Flask, request, jsonify, session
+import time
+from startup import StartupReport
+
+# Boot phases are timed from here so slow cold starts are visible in /api/health
+startup_report = StartupReport()
+
+from flask import Flask, Response, g, request, jsonify, session, stream_with_context
 from flask_cors import CORS
 import hashlib
+import hmac
 import json
-import time
 from datetime import datetime
 from config import Config
 from auth import auth_bp, init_oauth
 from news_service import NewsService
+from http_client import HttpClient
+from cache import TTLCache
+from summary_cache import SummaryCache
+from translation_cache import TranslationCache
+from rate_limiter import AdaptiveRateLimiter
+from feed_service import FeedService, FeedStore
+from single_flight import LeaseStore, SingleFlight
+from prefetch import PrefetchScheduler, parse_prefetch_keys
+from share_store import create_share_store
+from search_index import ArticleIndex
+from article_store import ArticleStore
+from response_cache import ResponseCache
+from dedup import DuplicateIndex, collapse_clusters
+from extractive import ExtractiveSummarizer
+from metrics import Metrics, NullMetrics, category_label, language_label
+from profiling import PROFILE_MODES, RequestProfiler
+from deadline import Deadline
+from circuit_breaker import CircuitBreaker
 import os
 
+startup_report.mark('imports')
+
 app = Flask(__name__)
 app.config.from_object(Config)
 app.secret_key = app.config['SECRET_KEY']
@@ -42,19 +68,145 @@ CORS(app, supports_credentials=True, origins=[
 
 # Initialize OAuth
 oauth, google, github = init_oauth(app)
+startup_report.mark('oauth')
+
+# Coalesces identical in-flight summaries and feed builds
+single_flight = SingleFlight(
+    LeaseStore(os.path.join(app.config['CACHE_DIR'], 'leases.db'))
+    if app.config['SINGLE_FLIGHT_CROSS_PROCESS'] else None,
+    lease_ttl=app.config['SINGLE_FLIGHT_LEASE_TTL'],
+    wait_timeout=app.config['SINGLE_FLIGHT_WAIT']
+)
+
+# Request/stage latencies and counters, summed across workers at /api/metrics
+metrics = Metrics(
+    os.path.join(app.config['CACHE_DIR'], 'metrics.db'),
+    flush_interval=app.config['METRICS_FLUSH_INTERVAL']
+) if app.config['METRICS_ENABLED'] else NullMetrics()
 
 # Initialize News Service
 news_service = NewsService(
     app.config['NEWS_API_KEY'],
     app.config['GEMINI_API_KEY'],
-    app.config.get('GOOGLE_TRANSLATE_KEY')
+    app.config.get('GOOGLE_TRANSLATE_KEY'),
+    http_client=HttpClient(
+        pool_size=app.config['HTTP_POOL_SIZE'],
+        connect_timeout=app.config['HTTP_CONNECT_TIMEOUT'],
+        read_timeout=app.config['HTTP_READ_TIMEOUT'],
+        max_retries=app.config['HTTP_MAX_RETRIES'],
+        backoff_factor=app.config['HTTP_BACKOFF_FACTOR']
+    ),
+    news_cache=TTLCache(
+        max_entries=app.config['NEWS_CACHE_MAX_ENTRIES'],
+        ttl=app.config['NEWS_CACHE_TTL'],
+        stale_ttl=app.config['NEWS_CACHE_STALE_TTL']
+    ) if app.config['NEWS_CACHE_TTL'] > 0 else None,
+    summary_cache=SummaryCache(
+        os.path.join(app.config['CACHE_DIR'], 'summaries.db'),
+        max_entries=app.config['SUMMARY_CACHE_MAX_ENTRIES'],
+        memory_entries=app.config['SUMMARY_CACHE_MEMORY_ENTRIES']
+    ) if app.config['SUMMARY_CACHE_ENABLED'] else None,
+    concurrency=app.config['PROCESS_CONCURRENCY'],
+    summary_batch_size=app.config['SUMMARY_BATCH_SIZE'],
+    summary_batch_token_budget=app.config['SUMMARY_BATCH_TOKEN_BUDGET'],
+    summary_tier=app.config['SUMMARY_TIER'],
+    metrics=metrics,
+    local_summarizer=ExtractiveSummarizer(
+        max_sentences=app.config['LOCAL_SUMMARY_SENTENCES'],
+        max_chars=app.config['LOCAL_SUMMARY_MAX_CHARS']
+    ),
+    gemini_limiter=AdaptiveRateLimiter(
+        os.path.join(app.config['CACHE_DIR'], 'ratelimit.db'),
+        name='gemini',
+        max_rate=app.config['GEMINI_MAX_RATE'],
+        min_rate=app.config['GEMINI_MIN_RATE'],
+        burst=app.config['GEMINI_BURST'],
+        max_wait=app.config['GEMINI_MAX_WAIT']
+    ) if app.config['GEMINI_RATE_LIMIT_ENABLED'] else None,
+    gemini_max_attempts=app.config['GEMINI_MAX_ATTEMPTS'],
+    breakers={
+        upstream: CircuitBreaker(
+            os.path.join(app.config['CACHE_DIR'], 'breakers.db'),
+            name=upstream,
+            failure_threshold=app.config['BREAKER_FAILURE_THRESHOLD'],
+            cooldown=app.config['BREAKER_COOLDOWN']
+        )
+        for upstream in ('newsapi', 'gemini', 'translate')
+    } if app.config['BREAKER_ENABLED'] else None,
+    single_flight=single_flight,
+    translation_cache=TranslationCache(
+        os.path.join(app.config['CACHE_DIR'], 'translations.db'),
+        ttl=app.config['TRANSLATION_CACHE_TTL'],
+        max_entries=app.config['TRANSLATION_CACHE_MAX_ENTRIES'],
+        memory_entries=app.config['TRANSLATION_CACHE_MEMORY_ENTRIES']
+    ) if app.config['TRANSLATION_CACHE_ENABLED'] else None,
+    translate_batch_size=app.config['TRANSLATE_BATCH_SIZE'],
+    model_cache_path=os.path.join(app.config['CACHE_DIR'], 'gemini_model.json'),
+    model_cache_ttl=app.config['GEMINI_MODEL_CACHE_TTL'],
+    article_index=ArticleIndex(
+        os.path.join(app.config['CACHE_DIR'], 'search.db'),
+        max_candidates=app.config['SEARCH_MAX_CANDIDATES']
+    ) if app.config['SEARCH_INDEX_ENABLED'] else None,
+    article_store=ArticleStore(
+        os.path.join(app.config['CACHE_DIR'], 'articles.db'),
+        ttl=app.config['ARTICLE_STORE_TTL'],
+        max_entries=app.config['ARTICLE_STORE_MAX_ENTRIES']
+    ),
+    duplicate_index=DuplicateIndex(
+        max_entries=app.config['DEDUP_MAX_ENTRIES'],
+        threshold=app.config['DEDUP_THRESHOLD']
+    ) if app.config['DEDUP_ENABLED'] else None
+)
+startup_report.mark('news_service')
+
+# Processed feeds shared by all workers
+feed_service = FeedService(
+    news_service,
+    FeedStore(os.path.join(app.config['CACHE_DIR'], 'feeds.db')),
+    ttl=app.config['FEED_TTL'],
+    stale_ttl=app.config['FEED_STALE_TTL'],
+    single_flight=single_flight,
+    max_versions=app.config['FEED_MAX_VERSIONS']
 )
 
+# Keep popular feeds warm (only the worker holding the leader lock refreshes)
+prefetch_scheduler = None
+if app.config['PREFETCH_ENABLED'] and app.config['NEWS_API_KEY']:
+    prefetch_scheduler = PrefetchScheduler(
+        feed_service,
+        parse_prefetch_keys(
+            app.config['PREFETCH_CATEGORIES'],
+            app.config['PREFETCH_LANGUAGES'],
+            app.config['PREFETCH_USER_LANGUAGES']
+        ),
+        lock_path=os.path.join(app.config['CACHE_DIR'], 'prefetch.lock'),
+        interval=app.config['PREFETCH_INTERVAL'],
+        jitter=app.config['PREFETCH_JITTER']
+    )
+    prefetch_scheduler.start()
+
+# Serialized, compressed feed bodies per feed key
+response_cache = ResponseCache(max_entries=app.config['RESPONSE_CACHE_MAX_ENTRIES'], metrics=metrics)
+
+startup_report.mark('feeds')
+
+# Admin-only profiling of single requests
+request_profiler = RequestProfiler(
+    app.config['PROFILE_DIR'],
+    max_per_minute=app.config['PROFILE_MAX_PER_MINUTE'],
+    sample_interval=app.config['PROFILE_SAMPLE_INTERVAL']
+) if app.config.get('PROFILE_TOKEN') else None
+
 # Register blueprints
 app.register_blueprint(auth_bp, url_prefix='/auth')
 
-# In-memory storage for shared articles (replace with DB later)
-shared_articles = {}
+# Storage for shared articles (SQLite by default, so every worker sees every share)
+share_store = create_share_store(
+    app.config['SHARE_STORE_BACKEND'],
+    os.path.join(app.config['CACHE_DIR'], 'shared_articles.db'),
+    ttl=app.config['SHARE_TTL'],
+    max_entries=app.config['SHARE_MAX_ENTRIES']
+)
 
 # ADD THIS: Root route for Render health checks
 @app.route('/')
@@ -93,41 +245,419 @@ def test_oauth_config():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_time(response):
+    started = g.pop('request_started', None)
+    if started is not None and request.endpoint:
+        metrics.observe('request_duration_seconds', time.perf_counter() - started, {
+            'endpoint': request.endpoint,
+            'category': category_label(request.args.get('category')),
+            'language': language_label(request.args.get('userLanguage'))
+        })
+    return response
+
+@app.before_request
+def start_profiling():
+    """Profile this request when asked to by an admin
+
+    Set ``X-Profile`` (or the ``profile`` query flag) to ``cprofile`` (the
+    request thread, saved as pstats) or ``sample`` (every thread, saved as
+    speedscope JSON), and ``X-Profile-Token`` to PROFILE_TOKEN. The profile is
+    written to PROFILE_DIR and named in the ``X-Profile-File`` header, or
+    returned instead of the normal body with ``X-Profile-Output: inline``
+    (or ``profile_output=inline``). Streamed responses are only profiled
+    up to the first byte.
+    """
+    mode = request.headers.get('X-Profile') or request.args.get('profile')
+    if not mode or request_profiler is None:
+        return
+    if not token_matches(request.headers.get('X-Profile-Token'), app.config['PROFILE_TOKEN']):
+        return
+    mode = mode.lower() if mode.lower() in PROFILE_MODES else 'cprofile'
+    if not request_profiler.allow():
+        g.profile_status = 'rate-limited'
+        return
+    profile_session = request_profiler.session(mode, request.endpoint or 'unknown')
+    try:
+        profile_session.start()
+    except ValueError as e:
+        # Only one cProfile can be active per process
+        print(f"Profiling unavailable: {e}")
+        g.profile_status = 'unavailable'
+        return
+    g.profile_session = profile_session
+    g.profile_inline = (
+        request.headers.get('X-Profile-Output') or request.args.get('profile_output')
+    ) == 'inline'
+
+@app.after_request
+def finish_profiling(response):
+    profile_session = g.pop('profile_session', None)
+    if profile_session is None:
+        if 'profile_status' in g:
+            response.headers['X-Profile'] = g.profile_status
+        return response
+    profile_session.stop()
+    if g.get('profile_inline'):
+        body, mimetype = profile_session.report()
+        response = Response(body, mimetype=mimetype)
+    else:
+        try:
+            response.headers['X-Profile-File'] = request_profiler.save(profile_session, request.endpoint or 'unknown')
+        except OSError as e:
+            print(f"Could not write profile: {e}")
+    response.headers['X-Profile'] = 'captured'
+    return response
+
+@app.teardown_request
+def stop_profiling(error=None):
+    # Requests that failed before after_request must not leave a profiler running
+    profile_session = g.pop('profile_session', None)
+    if profile_session is not None:
+        profile_session.stop()
+
+def token_matches(supplied, expected):
+    """Constant-time comparison for admin tokens"""
+    return hmac.compare_digest((supplied or '').encode('utf-8'), expected.encode('utf-8'))
+
+@app.route('/api/metrics')
+def get_metrics():
+    """Prometheus metrics for all workers; requires ``Authorization: Bearer <METRICS_TOKEN>`` when one is set"""
+    if not isinstance(metrics, Metrics):
+        return jsonify({'error': 'Metrics are disabled'}), 404
+    token = app.config.get('METRICS_TOKEN')
+    if token and not token_matches(request.headers.get('Authorization'), f"Bearer {token}"):
+        return jsonify({'error': 'Not authorized'}), 401
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    health = {
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'service': 'News Dashboard API'
-    })
+        'service': 'News Dashboard API',
+        'startup': dict(startup_report.as_dict(), lazyInit=news_service.init_timings)
+    }
+    if news_service.gemini_limiter is not None:
+        health['geminiRateLimiter'] = news_service.gemini_limiter.stats()
+    if news_service.breakers:
+        health['circuitBreakers'] = {
+            upstream: breaker.stats() for upstream, breaker in news_service.breakers.items()
+        }
+        if any(breaker.get('state') != 'closed' for breaker in health['circuitBreakers'].values()):
+            health['status'] = 'degraded'
+    if news_service.summary_cache is not None:
+        # Hit/miss counters are per worker; /api/metrics has the totals across workers
+        health['summaryCache'] = news_service.summary_cache.stats()
+    if news_service.translation_cache is not None:
+        health['translationCache'] = news_service.translation_cache.stats()
+    if news_service.duplicate_index is not None:
+        health['duplicateIndex'] = news_service.duplicate_index.stats()
+    if prefetch_scheduler is not None:
+        health['prefetch'] = prefetch_scheduler.status()
+    return jsonify(health)
+
+def conditional_response(etag, build_response, vary=None):
+    """Answer If-None-Match with 304, otherwise build the response; both carry the ETag and caching headers
+
+    ``vary`` is the Vary header the full response carries; a 304 must repeat
+    it so shared caches keep one entry per variant.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = build_response()
+    response.set_etag(etag)
+    if vary:
+        response.headers['Vary'] = vary
+    response.headers['Cache-Control'] = (
+        f"public, max-age={app.config['FEED_CACHE_MAX_AGE']}, "
+        f"stale-while-revalidate={app.config['FEED_CACHE_STALE_WHILE_REVALIDATE']}"
+    )
+    return response
+
+def request_deadline():
+    """The latency budget for this request: REQUEST_DEADLINE, shortened by ``budgetMs`` if given"""
+    budget = app.config['REQUEST_DEADLINE'] if app.config['REQUEST_DEADLINE'] > 0 else None
+    budget_ms = request.args.get('budgetMs')
+    if budget_ms:
+        try:
+            client_budget = max(0.0, float(budget_ms) / 1000)
+        except ValueError:
+            raise ValueError('budgetMs must be a number')
+        budget = client_budget if budget is None else min(budget, client_budget)
+    return Deadline(budget) if budget is not None else None
+
+def partial_response(payload):
+    """A response with pending enrichment: never cached, so the next request picks up the finished work"""
+    response = jsonify(payload)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 @app.route('/api/news')
 def get_news():
-    """Fetch news articles"""
+    """Fetch news articles
+
+    With ``since`` (a cursor from an earlier response, or a timestamp) only
+    articles added or changed since then are returned, along with the ids of
+    removed articles. ``fullReload`` is set, and the whole feed returned,
+    when the cursor is too old to diff against. With ``cluster=true``
+    near-duplicate articles are merged into one story listing every source.
+
+    A feed that cannot be finished within the request's latency budget
+    (``budgetMs``, capped by REQUEST_DEADLINE) is returned with
+    ``partial: true``; articles still missing a summary or translation list
+    them in ``pending``.
+    """
     try:
         category = request.args.get('category', 'general')
         language = request.args.get('language', 'en')
         user_language = request.args.get('userLanguage', 'en')
+        since = request.args.get('since')
+        cluster = request.args.get('cluster', 'false').lower() == 'true'
+        try:
+            deadline = request_deadline()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # Fetch raw articles
-        news_data = news_service.fetch_news(category=category, language=language, page_size=20)
+        # Fetch and process articles (summarize, translate if needed), served from the feed store when warm
+        feed = feed_service.get_feed(category, language, user_language, deadline)
+        
+        if feed.get('status') == 'error':
+            return jsonify({'articles': [], 'error': feed.get('message', 'No articles found')})
+        
+        # The body depends only on the feed content and version, the echoed category and the cursor
+        changed_at = datetime.fromtimestamp(feed['changedAt']).isoformat()
+        payload = {
+            'articles': feed.get('articles', []),
+            'category': category,
+            'timestamp': changed_at,
+            'updatedAt': changed_at,
+            'totalResults': feed.get('totalResults', 0),
+            'cursor': feed_service.cursor(feed)
+        }
+        if feed.get('partial'):
+            # Not a stored version, so there is nothing to diff against or resume from
+            del payload['cursor']
+            payload['partial'] = True
+            if cluster:
+                payload['articles'] = collapse_clusters(payload['articles'])
+            return partial_response(payload)
+        if since:
+            try:
+                changes = feed_service.changes_since(
+                    feed_service.make_key(category, language, user_language), feed, since
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            payload['incremental'] = changes is not None
+            payload['fullReload'] = changes is None
+            if changes is not None:
+                payload['articles'] = changes['articles']
+                payload['removed'] = changes['removed']
+        if cluster:
+            payload['articles'] = collapse_clusters(payload['articles'])
+        
+        if since:
+            etag = hashlib.sha256(
+                f"{feed['etag']}|{feed.get('version', 0)}|{category}|{since}|{cluster}".encode('utf-8')
+            ).hexdigest()[:32]
+            return conditional_response(etag, lambda: jsonify(payload))
+        
+        # Full feeds are served from bytes serialized and compressed once per feed version
+        body = response_cache.get(
+            (feed_service.make_key(category, language, user_language), category, cluster),
+            f"{feed['etag']}|{feed.get('version', 0)}",
+            lambda: payload
+        )
+        coding = body.negotiate(request.accept_encodings)
+        etag = body.etag if coding == 'identity' else f"{body.etag}-{coding}"
+        return conditional_response(etag, lambda: body.response(coding), vary='Accept-Encoding')
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/news/batch', methods=['GET', 'POST'])
+def get_news_batch():
+    """Fetch several feeds in one request
+
+    POST ``{"feeds": [{"category": ..., "language": ..., "userLanguage": ...}]}``,
+    or GET with ``categories`` (comma separated) plus ``language`` and
+    ``userLanguage``. Feeds are resolved together, so articles shared between
+    them are summarized and translated only once. ``cluster`` merges
+    near-duplicate articles and ``budgetMs`` bounds the latency, as in
+    /api/news.
+    """
+    try:
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            specs = data.get('feeds')
+            if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+                return jsonify({'error': 'feeds must be a list of objects'}), 400
+            default_language = data.get('language', 'en')
+            default_user_language = data.get('userLanguage', 'en')
+            cluster = data.get('cluster') is True
+        else:
+            specs = [
+                {'category': category.strip()}
+                for category in request.args.get('categories', 'general').split(',') if category.strip()
+            ]
+            default_language = request.args.get('language', 'en')
+            default_user_language = request.args.get('userLanguage', 'en')
+            cluster = request.args.get('cluster', 'false').lower() == 'true'
         
-        if not news_data or news_data.get('status') == 'error':
-            return jsonify({'articles': [], 'error': news_data.get('message', 'No articles found')})
+        if not specs:
+            return jsonify({'error': 'No feeds requested'}), 400
+        if len(specs) > app.config['BATCH_MAX_FEEDS']:
+            return jsonify({'error': f"At most {app.config['BATCH_MAX_FEEDS']} feeds per request"}), 400
+        try:
+            deadline = request_deadline()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # Process articles (summarize, translate if needed)
-        processed_data = news_service.process_news_data(
-            news_data, 
-            summarize=True, 
-            translate_to=user_language if user_language != 'en' else None
+        requested = [
+            (
+                spec.get('category', 'general'),
+                spec.get('language', default_language),
+                spec.get('userLanguage', default_user_language)
+            )
+            for spec in specs
+        ]
+        feeds = feed_service.get_feeds(
+            [feed_service.make_key(*feed_request) for feed_request in requested], deadline
         )
         
+        results = []
+        for category, language, user_language in requested:
+            feed = feeds[feed_service.make_key(category, language, user_language)]
+            result = {'category': category, 'language': language, 'userLanguage': user_language}
+            if feed.get('status') == 'error':
+                result.update({'articles': [], 'error': feed.get('message', 'No articles found')})
+            else:
+                changed_at = datetime.fromtimestamp(feed['changedAt']).isoformat()
+                articles = feed.get('articles', [])
+                result.update({
+                    'articles': collapse_clusters(articles) if cluster else articles,
+                    'updatedAt': changed_at,
+                    'totalResults': feed.get('totalResults', 0)
+                })
+                if feed.get('partial'):
+                    result['partial'] = True
+                else:
+                    result['cursor'] = feed_service.cursor(feed)
+            results.append(result)
+        
+        payload = {'feeds': results, 'timestamp': datetime.now().isoformat()}
+        if any(result.get('partial') for result in results):
+            payload['partial'] = True
+            return partial_response(payload)
+        return jsonify(payload)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Fields added to an article by summarization and translation
+ENRICHMENT_FIELDS = ('summary', 'translated_title', 'translatedDescription', 'translated_summary')
+
+def sse_event(event, data):
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.route('/api/news/stream')
+def stream_news():
+    """Stream news articles as Server-Sent Events
+
+    Emits an ``articles`` event with the un-enriched list straight away, an
+    ``article`` event with the summary/translation fields of each article as
+    it finishes, and a final ``done`` event.
+    """
+    category = request.args.get('category', 'general')
+    language = request.args.get('language', 'en')
+    user_language = request.args.get('userLanguage', 'en')
+    
+    def generate():
+        try:
+            news_data = news_service.fetch_news(category=category, language=language, page_size=20)
+            if not news_data or news_data.get('status') == 'error':
+                yield sse_event('error', {'error': news_data.get('message', 'No articles found')})
+                yield sse_event('done', {'count': 0})
+                return
+            
+            articles = news_service.prepare_articles(news_data)
+            yield sse_event('articles', {
+                'articles': articles,
+                'category': category,
+                'timestamp': datetime.now().isoformat(),
+                'totalResults': news_data.get('totalResults', len(articles))
+            })
+            
+            translate_to = user_language if user_language != 'en' else None
+            for index, article in news_service.iter_processed_articles(news_data, True, translate_to, category):
+                update = {'index': index, 'id': article['id']}
+                update.update({field: article[field] for field in ENRICHMENT_FIELDS if field in article})
+                yield sse_event('article', update)
+            
+            yield sse_event('done', {'count': len(articles)})
+        except Exception as e:
+            yield sse_event('error', {'error': str(e)})
+            yield sse_event('done', {'count': 0})
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/api/search')
+def search_articles():
+    """Search articles in the local index, topping up from NewsAPI when it has too few"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'error': 'Missing search query (q)'}), 400
+        
+        category = request.args.get('category')
+        source = request.args.get('source')
+        date_from = request.args.get('from')
+        date_to = request.args.get('to')
+        page = max(1, request.args.get('page', 1, type=int))
+        page_size = min(100, max(1, request.args.get('pageSize', 20, type=int)))
+        
+        results = {'articles': [], 'total': 0, 'more': False}
+        if news_service.article_index is not None:
+            results = news_service.article_index.search(
+                query, category=category, source=source, date_from=date_from, date_to=date_to,
+                page=page, page_size=page_size
+            )
+        articles = results['articles']
+        total = results['total']
+        origin = 'local'
+        
+        # Only go upstream for an unfiltered first page that the index cannot fill
+        filtered = category or source or date_from or date_to
+        if page == 1 and not filtered and total < app.config['SEARCH_MIN_LOCAL_RESULTS']:
+            news_data = news_service.fetch_news(query=query, page_size=page_size)
+            if news_data.get('status') != 'error':
+                # Unsummarized results must not overwrite stored, summarized copies of the same articles
+                processed_data = news_service.process_news_data(news_data, summarize=False, record=False)
+                seen = {article.get('url') for article in articles}
+                extra = [article for article in processed_data['articles'] if article.get('url') not in seen]
+                articles = (articles + extra)[:page_size]
+                total += len(extra)
+                origin = 'local+newsapi'
+        
         return jsonify({
-            'articles': processed_data.get('articles', []),
-            'category': category,
-            'timestamp': datetime.now().isoformat(),
-            'totalResults': processed_data.get('totalResults', 0)
+            'articles': articles,
+            'query': query,
+            'page': page,
+            'pageSize': page_size,
+            'totalResults': total,
+            'moreResults': results['more'],
+            'source': origin
         })
         
     except Exception as e:
@@ -135,14 +665,18 @@ def get_news():
 
 @app.route('/api/article/<article_id>')
 def get_article(article_id):
-    """Get full article details"""
+    """Get full article details, including its summary and cached translations"""
     try:
-        # This would typically fetch from database
-        # For now, we'll return a placeholder response
-        return jsonify({
-            'id': article_id,
-            'message': 'Article details would be fetched from database'
-        })
+        record = news_service.article_store.get(article_id)
+        if record is None:
+            return jsonify({'error': 'Article not found'}), 404
+        
+        article = dict(record['article'])
+        user_language = request.args.get('userLanguage', 'en')
+        if user_language != 'en':
+            article.update(record['translations'].get(user_language, {}))
+        article['translations'] = record['translations']
+        return jsonify(article)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -161,12 +695,8 @@ def share_article():
             f"{article_data.get('url', '')}{time.time()}".encode()
         ).hexdigest()[:12]
         
-        # Store article data (in production, use database)
-        shared_articles[share_id] = {
-            'article': article_data,
-            'created_at': datetime.now().isoformat(),
-            'views': 0
-        }
+        # Store article data
+        share_store.create(share_id, article_data)
         
         # Use environment variable for base URL or default to request host
         base_url = request.host_url.rstrip('/')
@@ -184,13 +714,12 @@ def share_article():
 def get_shared_article(share_id):
     """Get shared article by ID"""
     try:
-        if share_id not in shared_articles:
+        # Increment view count and load the article in one step
+        shared = share_store.view(share_id)
+        if shared is None:
             return jsonify({'error': 'Article not found'}), 404
         
-        # Increment view count
-        shared_articles[share_id]['views'] += 1
-        
-        return jsonify(shared_articles[share_id])
+        return jsonify(shared)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -224,12 +753,20 @@ def not_found(error):
         'available_endpoints': [
             '/ (GET) - API info',
             '/api/health (GET) - Health check',
+            '/api/metrics (GET) - Prometheus metrics',
             '/api/news (GET) - Get news articles',
+            '/api/news/batch (GET, POST) - Get several news feeds at once',
+            '/api/news/stream (GET) - Stream news articles as Server-Sent Events',
+            '/api/search (GET) - Search articles',
+            '/api/article/<id> (GET) - Get article details',
             '/api/share (POST) - Share article',
             '/auth/login/github (GET) - GitHub login'
         ]
     }), 404
 
+startup_report.mark('stores_and_routes')
+print(startup_report.summary())
+
 if __name__ == '__main__':
     # Production settings
     port = int(os.environ.get('PORT', 5000))
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+
+from cache import TTLCache
+from sqlite_store import SQLiteStore
+
+# Per-language fields added by translation
+TRANSLATED_FIELDS = ('translated_title', 'translatedDescription', 'translated_summary')
+
+
+def article_id(url: str) -> str:
+    """Stable short id for an article, derived from its URL"""
+    return hashlib.sha256((url or '').encode('utf-8')).hexdigest()[:16]
+
+
+class ArticleStore(SQLiteStore):
+    """Processed articles by id, with translations kept per target language.
+
+    Lookups are a primary-key read, fronted by a short-lived in-memory LRU so
+    repeat reads skip SQLite entirely. Records look like
+    ``{'article': {...}, 'translations': {'fr': {...}}, 'updatedAt': <epoch>}``.
+    Articles not refreshed for ``ttl`` seconds expire, and the least recently
+    updated rows are dropped beyond ``max_entries``.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS articles (
+            id TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            translations TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_articles_updated ON articles (updated_at)',
+    )
+
+    # Purge expired and surplus rows after this many rows are written
+    PURGE_EVERY = 500
+
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 50000,
+                 memory_entries: int = 2000, memory_ttl: float = 60):
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory = TTLCache(max_entries=memory_entries, ttl=memory_ttl)
+        self._writes = 0
+        self._counter_lock = threading.Lock()
+
+    def put_many(self, articles: List[Dict], language: Optional[str] = None):
+        """Store processed articles; translated fields are filed under ``language``"""
+        conn = self.conn
+        now = time.time()
+        written = 0
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for article in articles:
+                if not article.get('id'):
+                    continue
+                base = {key: value for key, value in article.items() if key not in TRANSLATED_FIELDS}
+                row = conn.execute('SELECT translations FROM articles WHERE id = ?', (article['id'],)).fetchone()
+                translations = json.loads(row[0]) if row else {}
+                translated = {key: article[key] for key in TRANSLATED_FIELDS if key in article}
+                if language and language != 'en' and translated:
+                    translations[language] = translated
+                conn.execute(
+                    'INSERT OR REPLACE INTO articles (id, url, payload, translations, updated_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (article['id'], article.get('url', ''), json.dumps(base), json.dumps(translations), now)
+                )
+                self.memory.delete(article['id'])
+                written += 1
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        with self._counter_lock:
+            before = self._writes
+            self._writes += written
+            purge = self._writes // self.PURGE_EVERY > before // self.PURGE_EVERY
+        if purge:
+            self.purge()
+
+    def get(self, article_id: str) -> Optional[Dict]:
+        record = self.memory.get(article_id)
+        if record is not None:
+            return record
+        row = self.conn.execute(
+            'SELECT payload, translations, updated_at FROM articles WHERE id = ? AND updated_at > ?',
+            (article_id, time.time() - self.ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        record = {'article': json.loads(row[0]), 'translations': json.loads(row[1]), 'updatedAt': row[2]}
+        self.memory.set(article_id, record)
+        return record
+
+    def purge(self):
+        """Delete expired rows, then the least recently updated rows beyond max_entries"""
+        try:
+            self.conn.execute('DELETE FROM articles WHERE updated_at <= ?', (time.time() - self.ttl,))
+            self.conn.execute(
+                '''DELETE FROM articles WHERE id IN (
+                    SELECT id FROM articles ORDER BY updated_at DESC LIMIT -1 OFFSET ?
+                )''',
+                (self.max_entries,)
+            )
+        except Exception as e:
+            print(f"Article store purge error: {e}")
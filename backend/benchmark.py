@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark and load test for the News Dashboard backend.
+
+NewsAPI, Gemini and Google Translate are replaced by in-process fakes with
+configurable latency, jitter, error and 429 rates, so no API keys or network
+access are needed. Each scenario runs in its own process with an empty cache
+directory and drives the Flask app through its test client:
+
+    cold        /api/news with every cache emptied before each request
+    warm        /api/news for a feed that is already built
+    translated  cold /api/news with userLanguage=fr
+    share_view  POST /api/share followed by GET /api/shared/<id>
+    burst       concurrent clients hitting warm feeds across categories
+
+The backend is configured from the environment as usual, so settings such as
+GEMINI_MAX_RATE or SUMMARY_TIER can be varied between runs.
+
+Usage:
+    python benchmark.py                                  # run every scenario
+    python benchmark.py --scenario warm burst --requests 200
+    python benchmark.py --save-baseline bench.json       # store results
+    python benchmark.py --baseline bench.json            # compare; exit 1 on regression
+"""
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+SCENARIOS = ('cold', 'warm', 'translated', 'share_view', 'burst')
+
+CATEGORIES = ('general', 'business', 'technology', 'entertainment', 'health', 'science', 'sports')
+
+WORDS = (
+    'markets', 'government', 'election', 'court', 'climate', 'energy', 'startup', 'vaccine', 'league',
+    'festival', 'research', 'satellite', 'budget', 'strike', 'merger', 'storm', 'treaty', 'policy',
+    'inflation', 'championship', 'museum', 'hospital', 'battery', 'airline', 'harvest', 'protest'
+)
+
+
+class FakeUpstream:
+    """Latency, jitter and failure injection shared by the fakes"""
+
+    def __init__(self, latency: float, jitter: float, error_rate: float, rate_limit_rate: float, seed: int):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def wait(self) -> str:
+        """Sleep for one call and return its outcome: 'ok', 'error' or 'rate_limited'"""
+        with self.lock:
+            self.calls += 1
+            delay = self.latency * (1 + self.jitter * self.random.uniform(-1, 1))
+            roll = self.random.random()
+        time.sleep(max(0.0, delay))
+        if roll < self.rate_limit_rate:
+            return 'rate_limited'
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 'error'
+        return 'ok'
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload: dict):
+        self.status_code = status_code
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeNewsAPI(FakeUpstream):
+    """Stands in for the HttpClient used for NewsAPI; ``generation`` changes every article"""
+
+    def __init__(self, *args, page_size: int = 20, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_size = page_size
+        self.generation = 0
+        self.timeout = (3.05, 10.0)  # (connect, read), as on HttpClient
+
+    def get(self, url, params=None, **kwargs):
+        outcome = self.wait()
+        if outcome == 'rate_limited':
+            return FakeResponse(429, {'status': 'error', 'message': 'rateLimited'})
+        if outcome == 'error':
+            return FakeResponse(500, {'status': 'error', 'message': 'unexpectedError'})
+        params = params or {}
+        category = params.get('category', 'general')
+        articles = [self.article(category, index) for index in range(int(params.get('pageSize', self.page_size)))]
+        return FakeResponse(200, {'status': 'ok', 'totalResults': len(articles), 'articles': articles})
+
+    def article(self, category: str, index: int) -> dict:
+        rng = random.Random(f"{category}:{index}:{self.generation}")
+        words = [rng.choice(WORDS) for _ in range(60)]
+        sentences = [' '.join(words[i:i + 12]).capitalize() + '.' for i in range(0, 60, 12)]
+        return {
+            'title': f"{category.title()} story {index}: {' '.join(words[:6])}",
+            'description': ' '.join(sentences[:2]),
+            'content': ' '.join(sentences[2:]) + ' [+2400 chars]',
+            'url': f"https://news.example/{category}/{self.generation}/{index}",
+            'urlToImage': None,
+            'publishedAt': '2024-01-01T00:00:00Z',
+            'source': {'name': f"Source {index % 5}"}
+        }
+
+    def close(self):
+        pass
+
+
+class FakeGemini(FakeUpstream):
+    """Stands in for a Gemini GenerativeModel, answering single and batched summary prompts"""
+
+    model_name = 'models/fake-gemini'
+
+    def generate_content(self, prompt: str):
+        outcome = self.wait()
+        if outcome == 'rate_limited':
+            raise Exception("429 Resource has been exhausted (e.g. check quota).")
+        if outcome == 'error':
+            raise Exception("503 The service is currently unavailable.")
+        ids = re.findall(r'\[id: (\d+)\]', prompt)
+        text = json.dumps({i: f"Fake summary {i}." for i in ids}) if ids else "Fake summary."
+
+        class Reply:
+            pass
+        reply = Reply()
+        reply.text = text
+        return reply
+
+
+class FakeTranslate(FakeUpstream):
+    """Stands in for the google-cloud-translate v2 client"""
+
+    def translate(self, values, target_language=None, source_language=None):
+        outcome = self.wait()
+        if outcome == 'rate_limited':
+            raise Exception("429 User Rate Limit Exceeded")
+        if outcome == 'error':
+            raise Exception("503 Backend Error")
+        return [{'translatedText': f"[{target_language}] {value}"} for value in values]
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summarize_timings(name, timings, errors, elapsed, upstream_calls):
+    return {
+        'scenario': name,
+        'requests': len(timings),
+        'errors': errors,
+        'throughput': len(timings) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(timings, 0.50) * 1000,
+        'p95_ms': percentile(timings, 0.95) * 1000,
+        'p99_ms': percentile(timings, 0.99) * 1000,
+        'upstream_calls': upstream_calls
+    }
+
+
+def run_child(scenario, options):
+    """Run one scenario in this (fresh) process and return its results"""
+    import app as app_module
+
+    news_api = FakeNewsAPI(options['newsapi_latency'], options['jitter'], options['error_rate'],
+                           options['rate_limit_rate'], options['seed'])
+    gemini = FakeGemini(options['gemini_latency'], options['jitter'], options['error_rate'],
+                        options['rate_limit_rate'], options['seed'] + 1)
+    translate = FakeTranslate(options['translate_latency'], options['jitter'], options['error_rate'],
+                              options['rate_limit_rate'], options['seed'] + 2)
+    news_service = app_module.news_service
+    news_service.http = news_api
+    news_service.gemini_model = gemini
+    news_service.translate_client = translate
+    client = app_module.app.test_client()
+
+    def reset_caches():
+        news_api.generation += 1
+        app_module.feed_service.store.conn.execute('DELETE FROM feeds')
+        if news_service.news_cache is not None:
+            news_service.news_cache.clear()
+
+    timings = []
+    errors = 0
+    lock = threading.Lock()
+
+    def timed(call):
+        nonlocal errors
+        started = time.perf_counter()
+        response = call()
+        duration = time.perf_counter() - started
+        failed = response.status_code >= 400 or (
+            response.is_json and isinstance(response.get_json(), dict) and 'error' in response.get_json()
+        )
+        with lock:
+            timings.append(duration)
+            errors += failed
+        return response
+
+    count = options['requests']
+    started = time.perf_counter()
+    if scenario in ('cold', 'translated'):
+        user_language = 'fr' if scenario == 'translated' else 'en'
+        for index in range(count):
+            reset_caches()
+            category = CATEGORIES[index % len(CATEGORIES)]
+            timed(lambda: client.get(f'/api/news?category={category}&userLanguage={user_language}'))
+    elif scenario == 'warm':
+        client.get('/api/news?category=technology')
+        started = time.perf_counter()
+        for _ in range(count):
+            timed(lambda: client.get('/api/news?category=technology'))
+    elif scenario == 'share_view':
+        article = news_api.article('general', 0)
+
+        def share_and_view(index):
+            shared = timed(lambda: client.post('/api/share', json={'article': dict(article, url=f"{article['url']}?{index}")}))
+            share_id = shared.get_json().get('shareId')
+            for _ in range(3):
+                timed(lambda: client.get(f'/api/shared/{share_id}'))
+
+        with ThreadPoolExecutor(max_workers=options['clients']) as pool:
+            list(pool.map(share_and_view, range(count)))
+    elif scenario == 'burst':
+        for category in CATEGORIES:
+            client.get(f'/api/news?category={category}')
+        started = time.perf_counter()
+
+        def client_session(index):
+            rng = random.Random(index)
+            for _ in range(max(1, count // options['clients'])):
+                category = rng.choice(CATEGORIES)
+                timed(lambda: client.get(f'/api/news?category={category}'))
+
+        with ThreadPoolExecutor(max_workers=options['clients']) as pool:
+            list(pool.map(client_session, range(options['clients'])))
+    elapsed = time.perf_counter() - started
+
+    return summarize_timings(scenario, timings, errors, elapsed, {
+        'newsapi': news_api.calls, 'gemini': gemini.calls, 'translate': translate.calls
+    })
+
+
+def run_scenario(scenario, options):
+    """Run a scenario in a child process with its own empty cache directory"""
+    with tempfile.TemporaryDirectory(prefix='newsdigest-bench-') as cache_dir:
+        env = dict(
+            os.environ,
+            CACHE_DIR=cache_dir,
+            PREFETCH_ENABLED='false',
+            NEWS_API_KEY='benchmark',
+            GEMINI_API_KEY='benchmark',
+            GOOGLE_TRANSLATE_KEY='benchmark',
+            METRICS_FLUSH_INTERVAL='60',
+        )
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', scenario, '--options', json.dumps(options)],
+            cwd=os.path.dirname(os.path.abspath(__file__)), env=env, capture_output=True, text=True
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"Scenario {scenario} failed:\n{result.stderr or result.stdout}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages, comparing p95 latency and throughput"""
+    regressions = []
+    previous = {entry['scenario']: entry for entry in baseline.get('results', [])}
+    for result in results:
+        before = previous.get(result['scenario'])
+        if before is None:
+            continue
+        if before['p95_ms'] and result['p95_ms'] > before['p95_ms'] * (1 + tolerance):
+            regressions.append(
+                f"{result['scenario']}: p95 {result['p95_ms']:.1f} ms vs baseline {before['p95_ms']:.1f} ms"
+            )
+        if before['throughput'] and result['throughput'] < before['throughput'] * (1 - tolerance):
+            regressions.append(
+                f"{result['scenario']}: throughput {result['throughput']:.1f}/s "
+                f"vs baseline {before['throughput']:.1f}/s"
+            )
+    return regressions
+
+
+def print_table(results, baseline=None):
+    previous = {entry['scenario']: entry for entry in (baseline or {}).get('results', [])}
+    print(f"{'scenario':<12}{'requests':>9}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'  upstream calls (news/gemini/translate)'}")
+    for result in results:
+        calls = result['upstream_calls']
+        line = (f"{result['scenario']:<12}{result['requests']:>9}{result['errors']:>8}{result['throughput']:>10.1f}"
+                f"{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+                f"  {calls['newsapi']}/{calls['gemini']}/{calls['translate']}")
+        before = previous.get(result['scenario'])
+        if before is not None and before['p95_ms']:
+            line += f"  (p95 {100 * (result['p95_ms'] / before['p95_ms'] - 1):+.0f}% vs baseline)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline benchmark for the News Dashboard backend')
+    parser.add_argument('--scenario', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--requests', type=int, default=50, help='requests per scenario')
+    parser.add_argument('--clients', type=int, default=16, help='concurrent clients for burst and share_view')
+    parser.add_argument('--newsapi-latency', type=float, default=0.08, help='seconds')
+    parser.add_argument('--gemini-latency', type=float, default=0.4, help='seconds')
+    parser.add_argument('--translate-latency', type=float, default=0.06, help='seconds')
+    parser.add_argument('--jitter', type=float, default=0.2, help='latency jitter as a fraction of latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of upstream calls that fail')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='fraction of upstream calls answered 429')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--baseline', help='baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed regression before failing')
+    parser.add_argument('--save-baseline', help='write the results to this JSON file')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--options', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, json.loads(args.options))))
+        return 0
+
+    options = {
+        'requests': args.requests,
+        'clients': args.clients,
+        'newsapi_latency': args.newsapi_latency,
+        'gemini_latency': args.gemini_latency,
+        'translate_latency': args.translate_latency,
+        'jitter': args.jitter,
+        'error_rate': args.error_rate,
+        'rate_limit_rate': args.rate_limit_rate,
+        'seed': args.seed
+    }
+    results = []
+    for scenario in args.scenario:
+        print(f"Running {scenario}...", file=sys.stderr)
+        results.append(run_scenario(scenario, options))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({'options': options, 'results': results}, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"✗ Regression: {regression}")
+        if regressions:
+            return 1
+        print("✓ No regressions against the baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe, size-bounded LRU cache with per-entry expiry.
+
+    Expired entries remain readable for ``stale_ttl`` more seconds so callers
+    can serve them stale while a refresh runs; use ``get`` for fresh-only reads
+    and ``get_entry`` when the staleness of the value matters.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 300, stale_ttl: float = 0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_entry(self, key: Hashable) -> Tuple[Any, bool]:
+        """Return (value, is_fresh); value is None on a miss"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            value, expires_at = entry
+            now = time.monotonic()
+            if expires_at is not None and expires_at + self.stale_ttl <= now:
+                del self._data[key]
+                self.misses += 1
+                return None, False
+            self._data.move_to_end(key)
+            fresh = expires_at is None or expires_at > now
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value, fresh
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value, fresh = self.get_entry(key)
+        return value if fresh else default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self._data),
+            'maxEntries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses
+        }
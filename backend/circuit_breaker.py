@@ -0,0 +1,141 @@
+import time
+
+from sqlite_store import SQLiteStore
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open"""
+
+
+class CircuitBreaker(SQLiteStore):
+    """Closed / open / half-open circuit breaker shared by all workers through a SQLite row.
+
+    ``failure_threshold`` consecutive failures open the circuit, and calls are
+    refused for ``cooldown`` seconds. The first call after that is let
+    through as a probe (half-open): success closes the circuit, failure opens
+    it for another cool-down. Other calls are refused while the probe is in
+    flight, unless it has not reported back within ``probe_timeout``.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS circuit_breakers (
+            name TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            failures INTEGER NOT NULL,
+            opened_at REAL NOT NULL,
+            probe_at REAL NOT NULL
+        )''',
+    )
+
+    def __init__(self, path: str, name: str, failure_threshold: int = 5, cooldown: float = 30.0,
+                 probe_timeout: float = 30.0):
+        super().__init__(path)
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.probe_timeout = probe_timeout
+        self.conn.execute(
+            'INSERT OR IGNORE INTO circuit_breakers (name, state, failures, opened_at, probe_at) '
+            'VALUES (?, ?, 0, 0, 0)',
+            (name, CLOSED)
+        )
+
+    def _read(self):
+        return self.conn.execute(
+            'SELECT state, failures, opened_at, probe_at FROM circuit_breakers WHERE name = ?', (self.name,)
+        ).fetchone()
+
+    def _refuses(self, state: str, opened_at: float, probe_at: float, now: float) -> bool:
+        if state == OPEN:
+            return now - opened_at < self.cooldown
+        if state == HALF_OPEN:
+            return now - probe_at < self.probe_timeout
+        return False
+
+    def is_open(self) -> bool:
+        """Whether calls are currently refused, without claiming the probe"""
+        try:
+            state, _, opened_at, probe_at = self._read()
+        except Exception as e:
+            print(f"Circuit breaker error: {e}")
+            return False
+        return self._refuses(state, opened_at, probe_at, time.time())
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now; after the cool-down, the caller that gets True is the probe"""
+        try:
+            state, _, opened_at, probe_at = self._read()
+            now = time.time()
+            if state == CLOSED:
+                return True
+            if self._refuses(state, opened_at, probe_at, now):
+                return False
+            # Claim the probe; only one worker wins the update
+            cursor = self.conn.execute(
+                'UPDATE circuit_breakers SET state = ?, probe_at = ? '
+                'WHERE name = ? AND state = ? AND opened_at = ? AND probe_at = ?',
+                (HALF_OPEN, now, self.name, state, opened_at, probe_at)
+            )
+        except Exception as e:
+            # Never block upstream calls on a breaker storage problem
+            print(f"Circuit breaker error: {e}")
+            return True
+        if cursor.rowcount == 1:
+            print(f"⚠ Circuit breaker '{self.name}' half-open, probing upstream")
+            return True
+        return False
+
+    def record_success(self):
+        try:
+            state, failures, _, _ = self._read()
+            # The common case, a healthy upstream, costs a read and no write
+            if state == CLOSED and failures == 0:
+                return
+            self.conn.execute(
+                'UPDATE circuit_breakers SET state = ?, failures = 0 WHERE name = ?', (CLOSED, self.name)
+            )
+        except Exception as e:
+            print(f"Circuit breaker error: {e}")
+            return
+        if state != CLOSED:
+            print(f"✓ Circuit breaker '{self.name}' closed, upstream recovered")
+
+    def record_failure(self):
+        conn = self.conn
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                state, failures, _, _ = self._read()
+                failures += 1
+                opened = state == HALF_OPEN or (state == CLOSED and failures >= self.failure_threshold)
+                if opened:
+                    conn.execute(
+                        'UPDATE circuit_breakers SET state = ?, failures = ?, opened_at = ? WHERE name = ?',
+                        (OPEN, failures, time.time(), self.name)
+                    )
+                else:
+                    conn.execute('UPDATE circuit_breakers SET failures = ? WHERE name = ?', (failures, self.name))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        except Exception as e:
+            print(f"Circuit breaker error: {e}")
+            return
+        if opened:
+            print(f"✗ Circuit breaker '{self.name}' open after {failures} failures; retrying in {self.cooldown:g}s")
+
+    def stats(self) -> dict:
+        try:
+            state, failures, opened_at, probe_at = self._read()
+        except Exception as e:
+            return {'error': str(e)}
+        now = time.time()
+        stats = {'state': state, 'consecutiveFailures': failures, 'failureThreshold': self.failure_threshold}
+        if state == OPEN:
+            stats['retryIn'] = round(max(0.0, self.cooldown - (now - opened_at)), 2)
+        return stats
@@ -12,4 +12,114 @@ class Config:
     GITHUB_CLIENT_ID = os.getenv('GITHUB_CLIENT_ID')
     GITHUB_CLIENT_SECRET = os.getenv('GITHUB_CLIENT_SECRET')
     GOOGLE_TRANSLATE_KEY = os.getenv('GOOGLE_TRANSLATE_KEY')
-    FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
\ No newline at end of file
+    FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
+
+    # Outbound HTTP client (NewsAPI)
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '3.05'))
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '10'))
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+    HTTP_BACKOFF_FACTOR = float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5'))
+
+    # NewsAPI response cache
+    NEWS_CACHE_TTL = float(os.getenv('NEWS_CACHE_TTL', '300'))
+    NEWS_CACHE_STALE_TTL = float(os.getenv('NEWS_CACHE_STALE_TTL', '900'))
+    NEWS_CACHE_MAX_ENTRIES = int(os.getenv('NEWS_CACHE_MAX_ENTRIES', '128'))
+
+    # Parallel article enrichment (summaries and translations)
+    PROCESS_CONCURRENCY = int(os.getenv('PROCESS_CONCURRENCY', '8'))
+
+    # Batched Gemini summarization
+    SUMMARY_BATCH_SIZE = int(os.getenv('SUMMARY_BATCH_SIZE', '10'))
+    SUMMARY_BATCH_TOKEN_BUDGET = int(os.getenv('SUMMARY_BATCH_TOKEN_BUDGET', '6000'))
+
+    # Summarization tier ('llm', 'local' or 'local_then_llm') and local extractive summary size
+    SUMMARY_TIER = os.getenv('SUMMARY_TIER', 'llm')
+    LOCAL_SUMMARY_SENTENCES = int(os.getenv('LOCAL_SUMMARY_SENTENCES', '2'))
+    LOCAL_SUMMARY_MAX_CHARS = int(os.getenv('LOCAL_SUMMARY_MAX_CHARS', '320'))
+
+    # Adaptive Gemini rate limiter (requests per second, shared by all workers)
+    GEMINI_RATE_LIMIT_ENABLED = os.getenv('GEMINI_RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    GEMINI_MAX_RATE = float(os.getenv('GEMINI_MAX_RATE', '1.0'))
+    GEMINI_MIN_RATE = float(os.getenv('GEMINI_MIN_RATE', '0.05'))
+    GEMINI_BURST = float(os.getenv('GEMINI_BURST', '5'))
+    GEMINI_MAX_WAIT = float(os.getenv('GEMINI_MAX_WAIT', '20'))
+    GEMINI_MAX_ATTEMPTS = int(os.getenv('GEMINI_MAX_ATTEMPTS', '3'))
+    GEMINI_MODEL_CACHE_TTL = float(os.getenv('GEMINI_MODEL_CACHE_TTL', str(24 * 3600)))
+
+    # Circuit breakers for NewsAPI, Gemini and Translate (shared by all workers): this many
+    # consecutive failures open a breaker, which sends calls to the fallback until a probe
+    # after the cool-down (seconds) succeeds
+    BREAKER_ENABLED = os.getenv('BREAKER_ENABLED', 'true').lower() == 'true'
+    BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '5'))
+    BREAKER_COOLDOWN = float(os.getenv('BREAKER_COOLDOWN', '30'))
+
+    # Request coalescing (single-flight), optionally across workers via SQLite leases
+    SINGLE_FLIGHT_CROSS_PROCESS = os.getenv('SINGLE_FLIGHT_CROSS_PROCESS', 'true').lower() == 'true'
+    SINGLE_FLIGHT_LEASE_TTL = float(os.getenv('SINGLE_FLIGHT_LEASE_TTL', '120'))
+    SINGLE_FLIGHT_WAIT = float(os.getenv('SINGLE_FLIGHT_WAIT', '60'))
+
+    # Persistent caches (SQLite files shared by all workers)
+    CACHE_DIR = os.getenv('CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+    SUMMARY_CACHE_ENABLED = os.getenv('SUMMARY_CACHE_ENABLED', 'true').lower() == 'true'
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv('SUMMARY_CACHE_MAX_ENTRIES', '50000'))
+    SUMMARY_CACHE_MEMORY_ENTRIES = int(os.getenv('SUMMARY_CACHE_MEMORY_ENTRIES', '1000'))
+    TRANSLATION_CACHE_ENABLED = os.getenv('TRANSLATION_CACHE_ENABLED', 'true').lower() == 'true'
+    TRANSLATION_CACHE_TTL = float(os.getenv('TRANSLATION_CACHE_TTL', str(7 * 24 * 3600)))
+    TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv('TRANSLATION_CACHE_MAX_ENTRIES', '200000'))
+    TRANSLATION_CACHE_MEMORY_ENTRIES = int(os.getenv('TRANSLATION_CACHE_MEMORY_ENTRIES', '5000'))
+    TRANSLATE_BATCH_SIZE = int(os.getenv('TRANSLATE_BATCH_SIZE', '128'))
+
+    # Processed feed store and background prefetch
+    FEED_TTL = float(os.getenv('FEED_TTL', '300'))
+    FEED_STALE_TTL = float(os.getenv('FEED_STALE_TTL', '3600'))
+    FEED_MAX_VERSIONS = int(os.getenv('FEED_MAX_VERSIONS', '50'))
+    FEED_CACHE_MAX_AGE = int(os.getenv('FEED_CACHE_MAX_AGE', '60'))
+    FEED_CACHE_STALE_WHILE_REVALIDATE = int(os.getenv('FEED_CACHE_STALE_WHILE_REVALIDATE', '240'))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '256'))
+    BATCH_MAX_FEEDS = int(os.getenv('BATCH_MAX_FEEDS', '12'))
+    # Background prefetch of popular feeds; off by default because it costs NewsAPI quota
+    # without any traffic: one call per category x language every PREFETCH_INTERVAL seconds
+    # (7 categories every 240s is ~2,500 calls a day, above the free tier's daily limit)
+    PREFETCH_ENABLED = os.getenv('PREFETCH_ENABLED', 'false').lower() == 'true'
+    PREFETCH_CATEGORIES = os.getenv('PREFETCH_CATEGORIES', 'general,business,technology,entertainment,health,science,sports')
+    PREFETCH_LANGUAGES = os.getenv('PREFETCH_LANGUAGES', 'en')
+    PREFETCH_USER_LANGUAGES = os.getenv('PREFETCH_USER_LANGUAGES', 'en')
+    PREFETCH_INTERVAL = float(os.getenv('PREFETCH_INTERVAL', '240'))
+    PREFETCH_JITTER = float(os.getenv('PREFETCH_JITTER', '30'))
+
+    # Shared articles ('sqlite' is shared by all workers, 'memory' is per process)
+    SHARE_STORE_BACKEND = os.getenv('SHARE_STORE_BACKEND', 'sqlite')
+    SHARE_TTL = float(os.getenv('SHARE_TTL', str(30 * 24 * 3600)))
+    SHARE_MAX_ENTRIES = int(os.getenv('SHARE_MAX_ENTRIES', '100000'))
+
+    # Processed articles served by /api/article/<id>
+    ARTICLE_STORE_TTL = float(os.getenv('ARTICLE_STORE_TTL', str(7 * 24 * 3600)))
+    ARTICLE_STORE_MAX_ENTRIES = int(os.getenv('ARTICLE_STORE_MAX_ENTRIES', '50000'))
+
+    # Local full-text search index
+    SEARCH_INDEX_ENABLED = os.getenv('SEARCH_INDEX_ENABLED', 'true').lower() == 'true'
+    SEARCH_MIN_LOCAL_RESULTS = int(os.getenv('SEARCH_MIN_LOCAL_RESULTS', '5'))
+    # Matches ranked per query (the most recently indexed); bounds the cost of common terms
+    SEARCH_MAX_CANDIDATES = int(os.getenv('SEARCH_MAX_CANDIDATES', '1000'))
+
+    # Near-duplicate story clustering (estimated Jaccard similarity of title + description)
+    DEDUP_ENABLED = os.getenv('DEDUP_ENABLED', 'true').lower() == 'true'
+    DEDUP_MAX_ENTRIES = int(os.getenv('DEDUP_MAX_ENTRIES', '5000'))
+    DEDUP_THRESHOLD = float(os.getenv('DEDUP_THRESHOLD', '0.5'))
+
+    # Prometheus metrics at /api/metrics (set METRICS_TOKEN to require a bearer token)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '5'))
+    METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+    # Opt-in per-request profiling, only for requests carrying X-Profile-Token (disabled when unset)
+    PROFILE_TOKEN = os.getenv('PROFILE_TOKEN')
+    PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(CACHE_DIR, 'profiles'))
+    PROFILE_MAX_PER_MINUTE = int(os.getenv('PROFILE_MAX_PER_MINUTE', '6'))
+    PROFILE_SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005'))
+
+    # End-to-end latency budget for feed requests, in seconds (0 disables); clients can
+    # shorten it with ?budgetMs=. Work still running at the deadline finishes in the
+    # background and is served from cache on the next request
+    REQUEST_DEADLINE = float(os.getenv('REQUEST_DEADLINE', '10'))
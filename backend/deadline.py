@@ -0,0 +1,38 @@
+import time
+from concurrent.futures import Executor, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Optional
+
+
+class Deadline:
+    """The point by which a request must answer, measured on the monotonic clock"""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def timeout(self, limit: Optional[float] = None) -> float:
+        """Seconds left, capped at ``limit``; for bounding waits and socket timeouts"""
+        return self.remaining() if limit is None else min(limit, self.remaining())
+
+
+def run_within(deadline: Optional[Deadline], fn: Callable[[], Any], fallback: Callable[[], Any],
+               executor: Executor) -> Any:
+    """Return ``fn()``, or ``fallback()`` if the deadline passes first
+
+    ``fn`` runs on ``executor`` and is left to finish in the background,
+    even when the deadline has already passed, so whatever it caches is
+    there for the next caller. When the executor is saturated ``fn`` may
+    only start after the deadline, and the fallback is used.
+    """
+    if deadline is None:
+        return fn()
+    future = executor.submit(fn)
+    try:
+        return future.result(timeout=deadline.remaining())
+    except FuturesTimeoutError:
+        return fallback()
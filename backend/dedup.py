@@ -0,0 +1,141 @@
+import hashlib
+import random
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Mersenne prime used for the MinHash permutations
+_PRIME = (1 << 61) - 1
+
+
+def shingles(text: str, size: int = 2) -> set:
+    """Word n-grams of lower-cased text"""
+    words = re.findall(r'\w+', (text or '').lower())
+    return {' '.join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))} if words else set()
+
+
+class DuplicateIndex:
+    """In-memory MinHash/LSH index of recent articles, for near-duplicate clustering.
+
+    Title + description shingles are reduced to ``num_perm`` MinHash values,
+    split into ``bands`` bands for LSH bucketing; candidates sharing a band
+    count as duplicates when their estimated Jaccard similarity reaches
+    ``threshold``. Each cluster is named after the id of its first article and
+    remembers one summary that all members reuse.
+    """
+
+    def __init__(self, max_entries: int = 5000, num_perm: int = 64, bands: int = 16,
+                 threshold: float = 0.5, seed: int = 1):
+        self.max_entries = max_entries
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+        self._entries = OrderedDict()  # article id -> (signature, cluster id)
+        self._buckets = {}             # (band, band values) -> set of article ids
+        self._sizes = {}               # cluster id -> indexed members
+        self._summaries = {}           # cluster id -> summary
+        self._lock = threading.Lock()
+
+    def signature(self, article: Dict) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of an article's title and description, or None if it has no text"""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+            for shingle in shingles(f"{article.get('title') or ''} {article.get('description') or ''}")
+        ]
+        if not hashes:
+            return None
+        return tuple(min((a * value + b) % _PRIME for value in hashes) for a, b in self._perms)
+
+    def _bands(self, signature: Tuple[int, ...]):
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def similarity(self, first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for x, y in zip(first, second) if x == y) / self.num_perm
+
+    def cluster(self, articles: List[Dict]) -> List[str]:
+        """Assign each processed article (with an ``id``) to a cluster, indexing new ones"""
+        signatures = [
+            None if article['id'] in self._entries else self.signature(article) for article in articles
+        ]
+        with self._lock:
+            return [
+                self._assign(article['id'], signature) for article, signature in zip(articles, signatures)
+            ]
+
+    def _assign(self, article_id: str, signature: Optional[Tuple[int, ...]]) -> str:
+        entry = self._entries.get(article_id)
+        if entry is not None:
+            self._entries.move_to_end(article_id)
+            return entry[1]
+
+        cluster_id = article_id
+        if signature is not None:
+            candidates = set()
+            for band in self._bands(signature):
+                candidates.update(self._buckets.get(band, ()))
+            best = None
+            for candidate in candidates:
+                similarity = self.similarity(self._entries[candidate][0], signature)
+                if similarity >= self.threshold and (best is None or similarity > best[0]):
+                    best = (similarity, self._entries[candidate][1])
+            if best is not None:
+                cluster_id = best[1]
+            for band in self._bands(signature):
+                self._buckets.setdefault(band, set()).add(article_id)
+
+        self._entries[article_id] = (signature, cluster_id)
+        self._sizes[cluster_id] = self._sizes.get(cluster_id, 0) + 1
+        while len(self._entries) > self.max_entries:
+            self._evict()
+        return cluster_id
+
+    def _evict(self):
+        article_id, (signature, cluster_id) = self._entries.popitem(last=False)
+        if signature is not None:
+            for band in self._bands(signature):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.discard(article_id)
+                    if not bucket:
+                        del self._buckets[band]
+        self._sizes[cluster_id] -= 1
+        if not self._sizes[cluster_id]:
+            del self._sizes[cluster_id]
+            self._summaries.pop(cluster_id, None)
+
+    def get_summary(self, cluster_id: str) -> Optional[str]:
+        return self._summaries.get(cluster_id)
+
+    def set_summary(self, cluster_id: str, summary: str):
+        with self._lock:
+            if cluster_id in self._sizes:
+                self._summaries[cluster_id] = summary
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self._entries),
+            'clusters': len(self._sizes),
+            'summaries': len(self._summaries)
+        }
+
+
+def collapse_clusters(articles: List[Dict]) -> List[Dict]:
+    """Merge articles sharing a ``clusterId`` into their first member, listing every source"""
+    collapsed = []
+    by_cluster = {}
+    for article in articles:
+        cluster_id = article.get('clusterId')
+        source = {'name': article.get('source'), 'url': article.get('url')}
+        if cluster_id is None or cluster_id not in by_cluster:
+            story = dict(article, sources=[source])
+            collapsed.append(story)
+            if cluster_id is not None:
+                by_cluster[cluster_id] = story
+        else:
+            by_cluster[cluster_id]['sources'].append(source)
+    return collapsed
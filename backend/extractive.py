@@ -0,0 +1,110 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List
+
+# Sentence boundaries: terminal punctuation followed by whitespace and a likely sentence start
+_SENTENCE_BOUNDARY = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["”’)]))\s+(?=["“‘(]?[A-Z0-9])')
+
+# NewsAPI truncates content with a trailing "... [+1234 chars]"
+_TRUNCATION_MARKER = re.compile(r'\s*(?:…|\.\.\.)?\s*\[\+\d+ chars\]\s*$')
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9'\-]*")
+
+STOPWORDS = frozenset('''
+a about after again against all also an and any are as at be because been before being between both but by
+can could did do does doing down during each few for from further had has have having he her here hers him
+his how i if in into is it its itself just me more most my no nor not now of off on once only or other our
+ours out over own said same she should so some such than that the their theirs them then there these they
+this those through to too under until up very was we were what when where which while who whom why will
+with would you your
+'''.split())
+
+
+class ExtractiveSummarizer:
+    """Local TF-IDF sentence-scoring summarizer; no network, well under a millisecond per article.
+
+    Sentences from the description and content are scored by the summed
+    TF-IDF weight of their terms (document frequencies come from the whole
+    batch, so words common to every article count for little), with a bonus
+    for words shared with the title and for appearing early. The top
+    ``max_sentences`` are returned in their original order.
+    """
+
+    def __init__(self, max_sentences: int = 2, max_chars: int = 320):
+        self.max_sentences = max(1, max_sentences)
+        self.max_chars = max_chars
+
+    def summarize(self, title: str, description: str, content: str) -> str:
+        return self.summarize_many([{'title': title, 'description': description, 'content': content}])[0]
+
+    def summarize_many(self, articles: List[Dict]) -> List[str]:
+        """Summarize a batch of articles (dicts with title, description and content) in one pass"""
+        documents = [self._sentences(article) for article in articles]
+        document_terms = [[self._terms(sentence) for sentence in sentences] for sentences in documents]
+
+        document_frequency = Counter()
+        for sentence_terms in document_terms:
+            document_frequency.update({term for terms in sentence_terms for term in terms})
+        total = len(documents) + 1
+        idf = {term: math.log(total / (1 + count)) + 1 for term, count in document_frequency.items()}
+
+        return [
+            self._summarize_document(article, sentences, sentence_terms, idf)
+            for article, sentences, sentence_terms in zip(articles, documents, document_terms)
+        ]
+
+    def _summarize_document(self, article: Dict, sentences: List[str], sentence_terms: List[List[str]],
+                            idf: Dict[str, float]) -> str:
+        if not sentences:
+            title = article.get('title')
+            return f"Article about: {title}" if title else "Summary unavailable"
+        if len(sentences) <= self.max_sentences:
+            return self._clip(' '.join(sentences))
+
+        term_frequency = Counter(term for terms in sentence_terms for term in terms)
+        title_terms = set(self._terms(article.get('title') or ''))
+        scores = []
+        for position, terms in enumerate(sentence_terms):
+            if not terms:
+                scores.append(0.0)
+                continue
+            weight = sum(term_frequency[term] * idf[term] for term in terms) / math.sqrt(len(terms))
+            weight *= 1 + 0.5 * len(title_terms.intersection(terms)) / (len(title_terms) or 1)
+            scores.append(weight / (1 + 0.15 * position))
+
+        ranked = sorted(range(len(sentences)), key=lambda index: scores[index], reverse=True)
+        chosen = sorted(ranked[:self.max_sentences])
+        return self._clip(' '.join(sentences[index] for index in chosen))
+
+    @staticmethod
+    def _sentences(article: Dict) -> List[str]:
+        """Unique sentences of the description followed by the (untruncated part of the) content"""
+        content = article.get('content') or ''
+        if content == '[Removed]':
+            content = ''
+        content = _TRUNCATION_MARKER.sub('', content)
+
+        sentences = []
+        seen = set()
+        for is_content, text in ((False, article.get('description') or ''), (True, content)):
+            for sentence in _SENTENCE_BOUNDARY.split(' '.join(text.split())):
+                sentence = sentence.strip()
+                normalized = sentence.lower()
+                if len(sentence) < 20 or normalized in seen:
+                    continue
+                # Skip the clipped tail left by truncated content
+                if is_content and sentence[-1] not in '.!?"”’)':
+                    continue
+                seen.add(normalized)
+                sentences.append(sentence)
+        return sentences
+
+    @staticmethod
+    def _terms(text: str) -> List[str]:
+        return [word for word in _WORD.findall(text.lower()) if word not in STOPWORDS and len(word) > 1]
+
+    def _clip(self, text: str) -> str:
+        if len(text) <= self.max_chars:
+            return text
+        return text[:self.max_chars].rsplit(' ', 1)[0].rstrip(',;:') + '...'
@@ -0,0 +1,452 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from deadline import Deadline
+from news_service import NewsService
+from single_flight import SingleFlight
+from sqlite_store import SQLiteStore
+
+
+# Article fields left out of content hashes: near-duplicate grouping can differ between workers
+UNHASHED_FIELDS = ('clusterId',)
+
+
+def _hashed(article: Dict) -> Dict:
+    return {name: value for name, value in article.items() if name not in UNHASHED_FIELDS}
+
+
+# Single-flight keys of feed builds, shared by single and batched refreshes
+FLIGHT_PREFIX = 'feed:'
+
+
+class FeedStore(SQLiteStore):
+    """Processed feeds per (category, language, userLanguage), shared by all workers"""
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS feeds (
+            key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )''',
+        '''CREATE TABLE IF NOT EXISTS feed_versions (
+            key TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            changed_at REAL NOT NULL,
+            article_hashes TEXT NOT NULL,
+            PRIMARY KEY (key, version)
+        )''',
+    )
+
+    def get(self, key: str) -> Tuple[Optional[Dict], Optional[float]]:
+        """Return (feed, updated_at), or (None, None) when the key is unknown"""
+        row = self.conn.execute('SELECT payload, updated_at FROM feeds WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None, None
+        feed = json.loads(row[0])
+        feed['updatedAt'] = row[1]
+        return feed, row[1]
+
+    def set(self, key: str, feed: Dict) -> float:
+        updated_at = time.time()
+        self.conn.execute(
+            'INSERT OR REPLACE INTO feeds (key, payload, updated_at) VALUES (?, ?, ?)',
+            (key, json.dumps(feed), updated_at)
+        )
+        return updated_at
+
+    def add_version(self, key: str, version: int, changed_at: float, article_hashes: Dict[str, str],
+                    max_versions: int):
+        """Record the article hashes of a feed version and prune the oldest snapshots"""
+        self.conn.execute(
+            'INSERT OR REPLACE INTO feed_versions (key, version, changed_at, article_hashes) VALUES (?, ?, ?, ?)',
+            (key, version, changed_at, json.dumps(article_hashes))
+        )
+        self.conn.execute(
+            'DELETE FROM feed_versions WHERE key = ? AND version <= ?', (key, version - max_versions)
+        )
+
+    def get_version(self, key: str, version: int) -> Optional[Dict[str, str]]:
+        row = self.conn.execute(
+            'SELECT article_hashes FROM feed_versions WHERE key = ? AND version = ?', (key, version)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def version_at(self, key: str, timestamp: float) -> Optional[int]:
+        """The version that was current at ``timestamp``, if it is still retained"""
+        row = self.conn.execute(
+            'SELECT version FROM feed_versions WHERE key = ? AND changed_at <= ? ORDER BY version DESC LIMIT 1',
+            (key, timestamp)
+        ).fetchone()
+        return row[0] if row else None
+
+    def updated_times(self) -> Dict[str, float]:
+        return dict(self.conn.execute('SELECT key, updated_at FROM feeds').fetchall())
+
+
+class FeedService:
+    """Fetch-and-process pipeline for whole feeds, backed by a FeedStore.
+
+    Fresh feeds are served straight from the store. Feeds older than ``ttl``
+    are still served, for up to ``stale_ttl`` more seconds, while one
+    background refresh per key runs; anything older is rebuilt inline.
+    """
+
+    def __init__(self, news_service: NewsService, store: FeedStore, ttl: float = 300,
+                 stale_ttl: float = 3600, page_size: int = 20, single_flight: Optional[SingleFlight] = None,
+                 max_versions: int = 50):
+        self.news_service = news_service
+        self.store = store
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.page_size = page_size
+        self.single_flight = single_flight
+        self.max_versions = max_versions
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(category: str, language: str, user_language: str) -> str:
+        return f"{(category or 'general').lower()}|{language or 'en'}|{user_language or 'en'}"
+
+    @staticmethod
+    def split_key(key: str) -> Tuple[str, str, str]:
+        category, language, user_language = key.split('|')
+        return category, language, user_language
+
+    def get_feed(self, category: str, language: str = 'en', user_language: str = 'en',
+                 deadline: Optional[Deadline] = None) -> Dict:
+        """Return the processed feed for a key, building it only when necessary
+
+        A feed built past its ``deadline`` is returned with ``partial`` set
+        and is not stored; see ``NewsService.process_news_data``.
+        """
+        feed = self._servable(self.make_key(category, language, user_language))
+        if feed is not None:
+            return feed
+        return self.refresh(category, language, user_language, deadline)
+
+    def get_feeds(self, keys: List[str], deadline: Optional[Deadline] = None) -> Dict[str, Dict]:
+        """Return several feeds at once, keyed by feed key
+
+        Feeds that need building are fetched concurrently and their articles
+        de-duplicated first, so an article appearing in several categories or
+        user languages is summarized once and translated once per language.
+        Feeds already being built, by a batch or a single refresh, are
+        awaited rather than built again, as in ``refresh``.
+        """
+        feeds = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            feed = self._servable(key)
+            if feed is None:
+                missing.append(key)
+            else:
+                feeds[key] = feed
+        if missing:
+            feeds.update(self._build_coalesced(missing, deadline))
+        return feeds
+
+    def _build_coalesced(self, keys: List[str], deadline: Optional[Deadline] = None) -> Dict[str, Dict]:
+        """Build several feeds, sharing the single-flight keys of ``refresh``"""
+        if self.single_flight is None:
+            return self._build_many(keys, deadline)
+        def feed_key(flight_key: str) -> str:
+            return flight_key[len(FLIGHT_PREFIX):]
+
+        def build(flight_keys: List[str]) -> Dict[str, Dict]:
+            built = self._build_many([feed_key(flight_key) for flight_key in flight_keys], deadline)
+            return {f"{FLIGHT_PREFIX}{key}": feed for key, feed in built.items()}
+
+        started = time.time()
+        feeds = self.single_flight.do_many(
+            [f"{FLIGHT_PREFIX}{key}" for key in keys],
+            build,
+            check=lambda flight_key: self._stored_since(feed_key(flight_key), started),
+            timeout=None if deadline is None else deadline.remaining(),
+            accept=lambda feed: deadline is not None or not feed.get('partial'),
+            on_timeout=lambda flight_key: self._pending_feed(feed_key(flight_key))
+        )
+        return {key: feeds[f"{FLIGHT_PREFIX}{key}"] for key in keys}
+
+    def _servable(self, key: str) -> Optional[Dict]:
+        """The stored feed if it is fresh or within the stale window (which triggers a refresh)"""
+        try:
+            feed, updated_at = self.store.get(key)
+        except Exception as e:
+            print(f"Feed store read error: {e}")
+            return None
+        if feed is None:
+            self.news_service.metrics.inc('cache_requests_total', {'cache': 'feed', 'result': 'miss'})
+            return None
+
+        feed.setdefault('etag', self.content_etag(feed))
+        feed.setdefault('changedAt', updated_at)
+        feed.setdefault('version', 0)
+        age = time.time() - updated_at
+        if age < self.ttl:
+            self.news_service.metrics.inc('cache_requests_total', {'cache': 'feed', 'result': 'hit'})
+            return feed
+        if age < self.ttl + self.stale_ttl:
+            self.news_service.metrics.inc('cache_requests_total', {'cache': 'feed', 'result': 'stale'})
+            self._refresh_async(key)
+            return feed
+        self.news_service.metrics.inc('cache_requests_total', {'cache': 'feed', 'result': 'miss'})
+        return None
+
+    def refresh(self, category: str, language: str = 'en', user_language: str = 'en',
+                deadline: Optional[Deadline] = None) -> Dict:
+        """Fetch and process a feed from upstream and store it
+
+        Concurrent refreshes of the same key, in this worker or another one,
+        share a single fetch-and-process run. A caller with a ``deadline``
+        waits for that run only as long as its budget allows, then gets a
+        partial feed (see ``_pending_feed``) rather than fetching again; a
+        partial feed is never handed to callers without a deadline.
+        """
+        key = self.make_key(category, language, user_language)
+        if self.single_flight is None:
+            return self._build(key, deadline)
+        started = time.time()
+        return self.single_flight.do(
+            f"{FLIGHT_PREFIX}{key}",
+            lambda: self._build(key, deadline),
+            check=lambda: self._stored_since(key, started),
+            timeout=None if deadline is None else deadline.remaining(),
+            accept=lambda feed: deadline is not None or not feed.get('partial'),
+            on_timeout=lambda: self._pending_feed(key)
+        )
+
+    def _pending_feed(self, key: str) -> Dict:
+        """What a caller gets when its deadline passes before the feed could be built
+
+        The last stored feed, however old, marked partial; an empty partial
+        feed if there is none.
+        """
+        try:
+            feed, updated_at = self.store.get(key)
+        except Exception:
+            feed = None
+        if feed is None:
+            feed = {'status': 'ok', 'articles': [], 'totalResults': 0}
+            feed['etag'] = self.content_etag(feed)
+            feed['changedAt'] = feed['updatedAt'] = time.time()
+        else:
+            feed.setdefault('etag', self.content_etag(feed))
+            feed.setdefault('changedAt', updated_at)
+        feed['partial'] = True
+        return feed
+
+    def _stored_since(self, key: str, since: float) -> Optional[Dict]:
+        """Return the stored feed if it was written at or after ``since``"""
+        try:
+            feed, updated_at = self.store.get(key)
+        except Exception:
+            return None
+        return feed if feed is not None and updated_at >= since else None
+
+    def _build(self, key: str, deadline: Optional[Deadline] = None) -> Dict:
+        category, language, user_language = self.split_key(key)
+        news_data = self.news_service.fetch_news(
+            category=category, language=language, page_size=self.page_size, use_cache=False, deadline=deadline
+        )
+        if not news_data or news_data.get('status') == 'error':
+            if deadline is not None and deadline.expired():
+                return self._pending_feed(key)
+            return self._fetch_error(news_data)
+
+        processed_data = self.news_service.process_news_data(
+            news_data,
+            summarize=True,
+            translate_to=user_language if user_language != 'en' else None,
+            category=category,
+            deadline=deadline
+        )
+        return self._store_feed(
+            key, processed_data.get('articles', []), processed_data.get('totalResults', 0),
+            partial=processed_data.get('partial', False)
+        )
+
+    def _build_many(self, keys: List[str], deadline: Optional[Deadline] = None) -> Dict[str, Dict]:
+        """Build several feeds, enriching each distinct article only once"""
+        sources = list(dict.fromkeys(self.split_key(key)[:2] for key in keys))
+        fetched = dict(zip(sources, self.news_service.executor.map(
+            lambda source: self.news_service.fetch_news(
+                category=source[0], language=source[1], page_size=self.page_size, use_cache=False,
+                deadline=deadline
+            ),
+            sources
+        )))
+
+        feeds = {}
+        unique = {}
+        for key in keys:
+            news_data = fetched[self.split_key(key)[:2]]
+            if not news_data or news_data.get('status') == 'error':
+                expired = deadline is not None and deadline.expired()
+                feeds[key] = self._pending_feed(key) if expired else self._fetch_error(news_data)
+                continue
+            for article in news_data.get('articles', []):
+                unique.setdefault(article.get('url') or id(article), article)
+
+        # Summaries are language independent, so one pass covers every feed
+        processed = self.news_service.process_news_data(
+            {'articles': list(unique.values())}, summarize=True, record=False, deadline=deadline
+        ).get('articles', [])
+        by_url = dict(zip(unique.keys(), processed))
+
+        translated = {'en': by_url}
+        for user_language in {self.split_key(key)[2] for key in keys if key not in feeds}:
+            if user_language == 'en':
+                continue
+            copies = {url: dict(article) for url, article in by_url.items()}
+            self.news_service.translate_articles(list(copies.values()), user_language, deadline)
+            translated[user_language] = copies
+
+        for key in keys:
+            if key in feeds:
+                continue
+            category, language, user_language = self.split_key(key)
+            news_data = fetched[(category, language)]
+            articles = [
+                translated[user_language][article.get('url') or id(article)]
+                for article in news_data.get('articles', [])
+            ]
+            self.news_service.record_articles(
+                articles, category, user_language if user_language != 'en' else None
+            )
+            feeds[key] = self._store_feed(
+                key, articles, news_data.get('totalResults', len(articles)),
+                partial=any(article.get('pending') for article in articles)
+            )
+        return feeds
+
+    @staticmethod
+    def _fetch_error(news_data: Optional[Dict]) -> Dict:
+        return {
+            'status': 'error',
+            'message': (news_data or {}).get('message', 'No articles found')
+        }
+
+    def _store_feed(self, key: str, articles: List[Dict], total_results: int, partial: bool = False) -> Dict:
+        """Version and store a freshly processed feed
+
+        A ``partial`` feed is returned as is: storing it would serve articles
+        with pending enrichment for a whole TTL.
+        """
+        feed = {
+            'status': 'ok',
+            'articles': articles,
+            'totalResults': total_results
+        }
+        feed['etag'] = self.content_etag(feed)
+        if partial:
+            feed['partial'] = True
+            feed['changedAt'] = feed['updatedAt'] = time.time()
+            return feed
+
+        # changedAt only moves when the content does, so unchanged refreshes keep the same ETag'd body
+        try:
+            previous, _ = self.store.get(key)
+        except Exception:
+            previous = None
+        if previous is not None and previous.get('etag') == feed['etag'] and previous.get('changedAt'):
+            feed['changedAt'] = previous['changedAt']
+            feed['version'] = previous.get('version', 0)
+        else:
+            feed['changedAt'] = time.time()
+            feed['version'] = (previous or {}).get('version', 0) + 1
+        try:
+            if feed['version'] != (previous or {}).get('version'):
+                self.store.add_version(
+                    key, feed['version'], feed['changedAt'],
+                    {article['id']: self.article_hash(article) for article in feed['articles']},
+                    self.max_versions
+                )
+            feed['updatedAt'] = self.store.set(key, feed)
+        except Exception as e:
+            print(f"Feed store write error: {e}")
+            feed['updatedAt'] = time.time()
+        return feed
+
+    def changes_since(self, key: str, feed: Dict, cursor: str) -> Optional[Dict]:
+        """Articles added or changed in ``feed`` since ``cursor``, plus ids that were removed
+
+        ``cursor`` is a token from an earlier response ("v<version>") or a
+        timestamp (epoch seconds or ISO 8601). Returns None when the cursor
+        predates the retained snapshots, meaning the client needs a full reload.
+        Raises ValueError for a malformed cursor.
+        """
+        version = self._resolve_cursor(key, cursor)
+        if version is None:
+            return None
+        current_version = feed.get('version', 0)
+        if version == current_version:
+            return {'articles': [], 'removed': []}
+        if version > current_version:
+            # The store was reset since the cursor was issued
+            return None
+
+        snapshot = self.store.get_version(key, version)
+        if snapshot is None:
+            return None
+        current = self.store.get_version(key, current_version) or {
+            article['id']: self.article_hash(article) for article in feed['articles']
+        }
+        changed = [
+            article for article in feed['articles']
+            if snapshot.get(article['id']) != current.get(article['id'])
+        ]
+        removed = [article_id for article_id in snapshot if article_id not in current]
+        return {'articles': changed, 'removed': removed}
+
+    def _resolve_cursor(self, key: str, cursor: str) -> Optional[int]:
+        if cursor.startswith('v') and cursor[1:].isdigit():
+            return int(cursor[1:])
+        try:
+            timestamp = float(cursor)
+        except ValueError:
+            try:
+                timestamp = datetime.fromisoformat(cursor.replace('Z', '+00:00')).timestamp()
+            except ValueError:
+                raise ValueError(f"Invalid since cursor: {cursor}")
+        return self.store.version_at(key, timestamp)
+
+    @staticmethod
+    def cursor(feed: Dict) -> str:
+        return f"v{feed.get('version', 0)}"
+
+    @staticmethod
+    def article_hash(article: Dict) -> str:
+        return hashlib.sha256(json.dumps(_hashed(article), sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def content_etag(feed: Dict) -> str:
+        """Strong validator for a feed's processed article set"""
+        content = json.dumps(
+            {'articles': [_hashed(article) for article in feed.get('articles', [])],
+             'totalResults': feed.get('totalResults', 0)},
+            sort_keys=True, separators=(',', ':')
+        )
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _refresh_async(self, key: str):
+        """Refresh a stale feed in the background, at most once per key"""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.refresh(*self.split_key(key))
+            except Exception as e:
+                print(f"Error refreshing feed {key}: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name='feed-refresh', daemon=True).start()
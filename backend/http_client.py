@@ -0,0 +1,85 @@
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+    """Shared, pooled HTTP session for outbound upstream calls.
+
+    A single keep-alive session is created lazily and reused by every thread,
+    so repeated calls to the same host skip the TCP/TLS handshake. Every
+    request gets a (connect, read) timeout and idempotent methods are retried
+    with exponential backoff. Calls bound by a request deadline can opt out of
+    retries, since backoff sleeps would outlast the budget; they use a second
+    session whose adapter never retries.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0, max_retries: int = 2,
+                 backoff_factor: float = 0.5):
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._session = None
+        self._single_attempt_session = None
+        self._lock = threading.Lock()
+
+    def _build_session(self, max_retries: int) -> requests.Session:
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=self.RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+            pool_block=True
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session(self.max_retries)
+        return self._session
+
+    @property
+    def single_attempt_session(self) -> requests.Session:
+        if self._single_attempt_session is None:
+            with self._lock:
+                if self._single_attempt_session is None:
+                    self._single_attempt_session = self._build_session(0)
+        return self._single_attempt_session
+
+    def get(self, url: str, params: Optional[Dict] = None, retry: bool = True, **kwargs) -> requests.Response:
+        """Issue a GET on the shared session with the default timeout; ``retry=False`` makes one attempt"""
+        kwargs.setdefault('timeout', self.timeout)
+        session = self.session if retry else self.single_attempt_session
+        return session.get(url, params=params, **kwargs)
+
+    def close(self):
+        with self._lock:
+            for session in (self._session, self._single_attempt_session):
+                if session is not None:
+                    session.close()
+            self._session = None
+            self._single_attempt_session = None
@@ -0,0 +1,203 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+from sqlite_store import SQLiteStore
+
+# Latency buckets in seconds, from cache hits up to slow upstream calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# name -> (type, help); names are exported with the ``newsdigest_`` prefix
+METRICS = {
+    'request_duration_seconds': ('histogram', 'Total request time by endpoint, category and language'),
+    'stage_duration_seconds': ('histogram', 'Time spent in each stage of the news pipeline'),
+    'upstream_errors_total': ('counter', 'Failed calls to upstream APIs'),
+    'rate_limited_total': ('counter', 'Rate-limited (429 / quota) responses from upstream APIs'),
+    'summary_fallbacks_total': ('counter', 'Summaries that fell back to the local summarizer'),
+    'circuit_rejections_total': ('counter', 'Upstream calls skipped because the circuit breaker was open'),
+    'cache_requests_total': ('counter', 'Cache lookups by cache and result'),
+}
+
+PREFIX = 'newsdigest_'
+
+# Label values outside these sets are reported as 'other', to bound the number of series
+CATEGORIES = frozenset(('all', 'general', 'business', 'technology', 'entertainment', 'health', 'science', 'sports'))
+
+
+def category_label(category: Optional[str]) -> str:
+    category = (category or 'all').lower()
+    return category if category in CATEGORIES else 'other'
+
+
+def language_label(language: Optional[str]) -> str:
+    language = (language or 'en').lower()
+    return language if len(language) == 2 and language.isalpha() else 'other'
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> str:
+    return json.dumps(sorted((labels or {}).items()))
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(pairs, extra: Tuple = ()) -> str:
+    pairs = list(pairs) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Metrics(SQLiteStore):
+    """Counters and latency histograms, aggregated across workers for Prometheus.
+
+    Each process accumulates in memory and periodically writes its running
+    totals to one row per (pid, metric, labels) in a shared SQLite file;
+    ``render`` sums those rows into the Prometheus text format. Totals of
+    workers that have exited stay in the sum, so counters never go backwards.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS metric_samples (
+            pid INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            labels TEXT NOT NULL,
+            value TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (pid, name, labels)
+        )''',
+    )
+
+    def __init__(self, path: str, flush_interval: float = 5.0, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(path)
+        self.flush_interval = flush_interval
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._counters = {}    # (name, label key) -> value
+        self._histograms = {}  # (name, label key) -> [bucket counts..., sum, count]
+        self._dirty = set()
+        self._last_flush = time.time()
+
+    def inc(self, name: str, labels: Optional[Dict[str, str]] = None, amount: float = 1):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._check_pid()
+            self._counters[key] = self._counters.get(key, 0) + amount
+            self._dirty.add(key)
+        self._maybe_flush()
+
+    def observe(self, name: str, seconds: float, labels: Optional[Dict[str, str]] = None):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._check_pid()
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self.buckets) + 2)
+            bucket = bisect_left(self.buckets, seconds)
+            if bucket < len(self.buckets):
+                histogram[bucket] += 1
+            histogram[-2] += seconds
+            histogram[-1] += 1
+            self._dirty.add(key)
+        self._maybe_flush()
+
+    @contextmanager
+    def timer(self, stage: str, **labels):
+        """Observe the duration of a block in ``stage_duration_seconds``"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe('stage_duration_seconds', time.perf_counter() - started, dict(labels, stage=stage))
+
+    def _check_pid(self):
+        # A forked worker must not report the totals it inherited from its parent
+        if os.getpid() != self._pid:
+            self._reset()
+
+    def _maybe_flush(self):
+        if time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write this process's changed totals to the shared store"""
+        with self._lock:
+            self._check_pid()
+            rows = []
+            now = time.time()
+            for key in self._dirty:
+                value = self._counters[key] if key in self._counters else self._histograms[key]
+                rows.append((self._pid, key[0], key[1], json.dumps(value), now))
+            self._dirty = set()
+            self._last_flush = now
+        if not rows:
+            return
+        try:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO metric_samples (pid, name, labels, value, updated_at) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+        except Exception as e:
+            print(f"Metrics write error: {e}")
+
+    def render(self) -> str:
+        """All workers' metrics in the Prometheus text exposition format"""
+        self.flush()
+        counters = {}
+        histograms = {}
+        for name, labels, value in self.conn.execute('SELECT name, labels, value FROM metric_samples'):
+            value = json.loads(value)
+            key = (name, labels)
+            if isinstance(value, list):
+                total = histograms.setdefault(key, [0] * len(value))
+                histograms[key] = [a + b for a, b in zip(total, value)]
+            else:
+                counters[key] = counters.get(key, 0) + value
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            series = sorted(key for key in (histograms if kind == 'histogram' else counters) if key[0] == name)
+            if not series:
+                continue
+            lines.append(f'# HELP {PREFIX}{name} {help_text}')
+            lines.append(f'# TYPE {PREFIX}{name} {kind}')
+            for key in series:
+                labels = [tuple(pair) for pair in json.loads(key[1])]
+                if kind == 'counter':
+                    lines.append(f'{PREFIX}{name}{_format_labels(labels)} {counters[key]:.15g}')
+                    continue
+                histogram = histograms[key]
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram):
+                    cumulative += count
+                    lines.append(f'{PREFIX}{name}_bucket{_format_labels(labels, (("le", f"{bound:g}"),))} {cumulative}')
+                lines.append(f'{PREFIX}{name}_bucket{_format_labels(labels, (("le", "+Inf"),))} {histogram[-1]}')
+                lines.append(f'{PREFIX}{name}_sum{_format_labels(labels)} {histogram[-2]:.6f}')
+                lines.append(f'{PREFIX}{name}_count{_format_labels(labels)} {histogram[-1]}')
+        return '\n'.join(lines) + '\n'
+
+
+class NullMetrics:
+    """Drop-in stand-in for Metrics when instrumentation is disabled"""
+
+    def inc(self, name: str, labels: Optional[Dict[str, str]] = None, amount: float = 1):
+        pass
+
+    def observe(self, name: str, seconds: float, labels: Optional[Dict[str, str]] = None):
+        pass
+
+    @contextmanager
+    def timer(self, stage: str, **labels):
+        yield
+
+    def flush(self):
+        pass
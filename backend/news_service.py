@@ -1,92 +1,314 @@
 import requests
+import importlib
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
-
-# Try to import Gemini AI
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    print("Warning: google-generativeai not installed. AI summarization will be disabled.")
-    GEMINI_AVAILABLE = False
-
-# Try to import Google Translate
-try:
-    from google.cloud import translate
-    TRANSLATE_AVAILABLE = True
-except ImportError:
-    print("Warning: google-cloud-translate not installed. Translation will be disabled.")
-    TRANSLATE_AVAILABLE = False
+from typing import List, Dict, Iterator, Optional, Tuple
+from http_client import HttpClient
+from cache import TTLCache
+from summary_cache import SummaryCache
+from rate_limiter import AdaptiveRateLimiter, RateLimitExceeded
+from single_flight import SingleFlight
+from translation_cache import TranslationCache
+from search_index import ArticleIndex
+from article_store import ArticleStore, article_id
+from dedup import DuplicateIndex
+from extractive import ExtractiveSummarizer
+from metrics import Metrics, NullMetrics, category_label, language_label
+from deadline import Deadline, run_within
+from circuit_breaker import CircuitBreaker, CircuitOpen
+
+# Gemini model names to try, most capable first
+GEMINI_MODEL_CANDIDATES = (
+    'models/gemini-1.5-pro-latest',
+    'models/gemini-1.5-flash-latest',
+    'models/gemini-1.5-pro',
+    'models/gemini-1.5-flash',
+)
+
+def _import_optional(module_name: str):
+    """Import an optional SDK on first use; returns None if it is not installed"""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+# Bump whenever the summary prompt changes so cached summaries are regenerated
+SUMMARY_PROMPT_VERSION = '1'
+
+# 'llm': Gemini, with local summaries only as a fallback; 'local': local summaries only;
+# 'local_then_llm': local summaries straight away, upgraded in the background by Gemini
+SUMMARY_TIERS = ('llm', 'local', 'local_then_llm')
+
+
+class LLMSummary(str):
+    """A summary written by Gemini, fresh or from the summary cache, as opposed to a local one
+
+    Only these are shared with near-duplicate articles or cached under their keys.
+    """
+
 
 class NewsService:
-    def __init__(self, news_api_key: str, gemini_api_key: str, google_translate_key: Optional[str] = None):
+    def __init__(self, news_api_key: str, gemini_api_key: str, google_translate_key: Optional[str] = None,
+                 http_client: Optional[HttpClient] = None, news_cache: Optional[TTLCache] = None,
+                 summary_cache: Optional[SummaryCache] = None, concurrency: int = 1,
+                 summary_batch_size: int = 1, summary_batch_token_budget: int = 6000,
+                 gemini_limiter: Optional[AdaptiveRateLimiter] = None, gemini_max_attempts: int = 3,
+                 single_flight: Optional[SingleFlight] = None, translation_cache: Optional[TranslationCache] = None,
+                 translate_batch_size: int = 128, model_cache_path: Optional[str] = None,
+                 model_cache_ttl: float = 24 * 3600, article_index: Optional[ArticleIndex] = None,
+                 article_store: Optional[ArticleStore] = None, duplicate_index: Optional[DuplicateIndex] = None,
+                 summary_tier: str = 'llm', local_summarizer: Optional[ExtractiveSummarizer] = None,
+                 metrics: Optional[Metrics] = None, breakers: Optional[Dict[str, CircuitBreaker]] = None):
         self.news_api_key = news_api_key
         self.gemini_api_key = gemini_api_key
         self.google_translate_key = google_translate_key
         
-        # Configure Gemini AI if available and API key provided
-        self.gemini_model = None
-        if GEMINI_AVAILABLE and gemini_api_key:
-            try:
-                genai.configure(api_key=gemini_api_key)
-                
-                # List available models for debugging
-                try:
-                    models = genai.list_models()
-                    print(f"Available Gemini models: {[m.name for m in models if 'gemini' in m.name.lower()]}")
-                except Exception as e:
-                    print(f"Could not list models: {e}")
-                
-                # Try different model names for compatibility
-                try:
-                    self.gemini_model = genai.GenerativeModel('models/gemini-1.5-pro-latest')
-                    print("✓ Gemini AI initialized successfully with gemini-1.5-pro-latest")
-                except:
-                    try:
-                        self.gemini_model = genai.GenerativeModel('models/gemini-1.5-flash-latest')
-                        print("✓ Gemini AI initialized successfully with gemini-1.5-flash-latest")
-                    except:
-                        try:
-                            self.gemini_model = genai.GenerativeModel('models/gemini-1.5-pro')
-                            print("✓ Gemini AI initialized successfully with gemini-1.5-pro")
-                        except:
-                            try:
-                                self.gemini_model = genai.GenerativeModel('models/gemini-1.5-flash')
-                                print("✓ Gemini AI initialized successfully with gemini-1.5-flash")
-                            except Exception as e:
-                                print(f"✗ All Gemini models failed: {e}")
-                                self.gemini_model = None
-            except Exception as e:
-                print(f"✗ Failed to initialize Gemini AI: {e}")
-                self.gemini_model = None
-        else:
-            if not GEMINI_AVAILABLE:
-                print("⚠ Gemini AI not available (package not installed)")
-            elif not gemini_api_key:
-                print("⚠ Gemini API key not provided - AI summarization disabled")
-        
-        # Initialize Google Translate client only if available and credentials provided
-        self.translate_client = None
-        if TRANSLATE_AVAILABLE and google_translate_key:
+        # Shared keep-alive session used for all outbound HTTP calls
+        self.http = http_client or HttpClient()
+        
+        # Optional response cache in front of fetch_news (stale-while-revalidate)
+        self.news_cache = news_cache
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        
+        # Optional persistent cache of generated summaries
+        self.summary_cache = summary_cache
+        
+        # Upper bound on articles enriched in parallel across all requests
+        self.concurrency = max(1, concurrency)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        
+        # Batched summarization limits (a batch size of 1 disables batching)
+        self.summary_batch_size = max(1, summary_batch_size)
+        self.summary_batch_token_budget = summary_batch_token_budget
+        
+        # Shared, adaptive limiter for Gemini requests
+        self.gemini_limiter = gemini_limiter
+        self.gemini_max_attempts = max(1, gemini_max_attempts)
+        
+        # Coalesces concurrent generation of the same summary
+        self.single_flight = single_flight
+        
+        # Batched, cached translation (the v2 API accepts up to 128 strings per call)
+        self.translation_cache = translation_cache
+        self.translate_batch_size = max(1, translate_batch_size)
+        
+        # Local full-text index fed by every processed page
+        self.article_index = article_index
+        
+        # Processed articles by id, for /api/article/<id>
+        self.article_store = article_store
+        
+        # Near-duplicate clustering, so copies of a wire story share one summary
+        self.duplicate_index = duplicate_index
+        
+        # Local extractive summaries, used as the fallback or as a tier of their own
+        if summary_tier not in SUMMARY_TIERS:
+            raise ValueError(f"Unknown summary tier: {summary_tier}")
+        self.summary_tier = summary_tier
+        self.local_summarizer = local_summarizer or ExtractiveSummarizer()
+        self._upgrading = set()
+        self._upgrade_lock = threading.Lock()
+        
+        # Stage latencies and upstream/cache counters, exported at /api/metrics
+        self.metrics = metrics or NullMetrics()
+        
+        # Circuit breakers by upstream ('newsapi', 'gemini', 'translate'); an open
+        # breaker sends calls straight to the fallback instead of waiting to fail
+        self.breakers = breakers or {}
+        
+        # Gemini and Google Translate clients are created on first use so that
+        # importing the SDKs and discovering models never delays startup
+        self.model_cache_path = model_cache_path
+        self.model_cache_ttl = model_cache_ttl
+        self._gemini_model = None
+        self._gemini_resolved = False
+        self._translate_client = None
+        self._translate_resolved = False
+        self._init_lock = threading.Lock()
+        self.init_timings = {}
+    
+    @property
+    def gemini_model(self):
+        """Gemini model, configured on first access"""
+        if not self._gemini_resolved:
+            with self._init_lock:
+                if not self._gemini_resolved:
+                    started = time.perf_counter()
+                    self._gemini_model = self._init_gemini()
+                    self.init_timings['geminiMs'] = round((time.perf_counter() - started) * 1000, 1)
+                    self._gemini_resolved = True
+        return self._gemini_model
+    
+    @gemini_model.setter
+    def gemini_model(self, model):
+        self._gemini_model = model
+        self._gemini_resolved = True
+    
+    @property
+    def translate_client(self):
+        """Google Translate client, created on first access"""
+        if not self._translate_resolved:
+            with self._init_lock:
+                if not self._translate_resolved:
+                    started = time.perf_counter()
+                    self._translate_client = self._init_translate()
+                    self.init_timings['translateMs'] = round((time.perf_counter() - started) * 1000, 1)
+                    self._translate_resolved = True
+        return self._translate_client
+    
+    @translate_client.setter
+    def translate_client(self, client):
+        self._translate_client = client
+        self._translate_resolved = True
+    
+    def _init_gemini(self):
+        """Configure Gemini AI if available and API key provided"""
+        if not self.gemini_api_key:
+            print("⚠ Gemini API key not provided - AI summarization disabled")
+            return None
+        genai = _import_optional('google.generativeai')
+        if genai is None:
+            print("⚠ Gemini AI not available (package not installed)")
+            return None
+        
+        try:
+            genai.configure(api_key=self.gemini_api_key)
+            model_name = self._choose_gemini_model(genai)
+            model = genai.GenerativeModel(model_name)
+            print(f"✓ Gemini AI initialized successfully with {model_name}")
+            return model
+        except Exception as e:
+            print(f"✗ Failed to initialize Gemini AI: {e}")
+            return None
+    
+    def _choose_gemini_model(self, genai) -> str:
+        """Pick the first available candidate model, using the on-disk choice while it is fresh"""
+        cached_model = self._read_model_cache()
+        if cached_model:
+            return cached_model
+        
+        try:
+            available = {
+                m.name for m in genai.list_models()
+                if 'generateContent' in getattr(m, 'supported_generation_methods', ['generateContent'])
+            }
+            print(f"Available Gemini models: {sorted(name for name in available if 'gemini' in name.lower())}")
+        except Exception as e:
+            print(f"Could not list models: {e}")
+            return GEMINI_MODEL_CANDIDATES[0]
+        
+        model_name = next((name for name in GEMINI_MODEL_CANDIDATES if name in available), GEMINI_MODEL_CANDIDATES[0])
+        self._write_model_cache(model_name)
+        return model_name
+    
+    def _read_model_cache(self) -> Optional[str]:
+        if not self.model_cache_path:
+            return None
+        try:
+            with open(self.model_cache_path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('model') not in GEMINI_MODEL_CANDIDATES:
+            return None
+        if time.time() - cached.get('chosenAt', 0) >= self.model_cache_ttl:
+            return None
+        return cached['model']
+    
+    def _write_model_cache(self, model_name: str):
+        if not self.model_cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.model_cache_path)), exist_ok=True)
+            temp_path = f"{self.model_cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump({'model': model_name, 'chosenAt': time.time()}, f)
+            os.replace(temp_path, self.model_cache_path)
+        except OSError as e:
+            print(f"Could not write Gemini model cache: {e}")
+    
+    def _init_translate(self):
+        """Initialize Google Translate client only if available and credentials provided"""
+        if not self.google_translate_key:
+            print("⚠ Google Translate key not provided - translation features disabled")
+            return None
+        translate = _import_optional('google.cloud.translate')
+        if translate is None:
+            print("⚠ Google Translate not available (package not installed)")
+            return None
+        
+        try:
+            # Try the correct import method for google-cloud-translate
+            if hasattr(translate, 'Client'):
+                client = translate.Client()
+            else:
+                # Fallback for newer versions
+                client = translate.TranslationServiceClient()
+            print("✓ Google Translate initialized successfully")
+            return client
+        except Exception as e:
+            print(f"✗ Failed to initialize Google Translate: {e}")
+            print("Translation features will be disabled")
+            return None
+    
+    def fetch_news(self, query: str = None, category: str = None, language: str = 'en', page_size: int = 20,
+                   use_cache: bool = True, deadline: Optional[Deadline] = None) -> Dict:
+        """Fetch news from News API, served from the response cache when possible
+
+        ``use_cache=False`` always goes upstream but still refreshes the cache.
+        With a ``deadline`` the upstream call is a single attempt, with its
+        timeouts cut to the time left, and is skipped once the time is up.
+        """
+        with self.metrics.timer('fetch_news', category=category_label(category), language=language_label(language)):
+            if self.news_cache is None:
+                return self._fetch_news_upstream(query, category, language, page_size, deadline)
+            
+            key = (query or '', (category or '').lower(), language, page_size)
+            cached, fresh = self.news_cache.get_entry(key) if use_cache else (None, False)
+            if use_cache:
+                result = 'miss' if cached is None else 'hit' if fresh else 'stale'
+                self.metrics.inc('cache_requests_total', {'cache': 'news', 'result': result})
+            if cached is not None:
+                if not fresh:
+                    self._refresh_news_async(key)
+                return cached
+            
+            news_data = self._fetch_news_upstream(query, category, language, page_size, deadline)
+            if news_data.get('status') != 'error':
+                self.news_cache.set(key, news_data)
+            elif not use_cache:
+                # Upstream is failing (or its breaker is open): a stale copy beats an error
+                cached, _ = self.news_cache.get_entry(key)
+                if cached is not None:
+                    return cached
+            return news_data
+    
+    def _refresh_news_async(self, key: tuple):
+        """Refresh a stale cache entry in the background, at most once per key"""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
             try:
-                # Try the correct import method for google-cloud-translate
-                if hasattr(translate, 'Client'):
-                    self.translate_client = translate.Client()
-                else:
-                    # Fallback for newer versions
-                    self.translate_client = translate.TranslationServiceClient()
-                print("✓ Google Translate initialized successfully")
-            except Exception as e:
-                print(f"✗ Failed to initialize Google Translate: {e}")
-                print("Translation features will be disabled")
-        else:
-            if not TRANSLATE_AVAILABLE:
-                print("⚠ Google Translate not available (package not installed)")
-            elif not google_translate_key:
-                print("⚠ Google Translate key not provided - translation features disabled")
+                news_data = self._fetch_news_upstream(*key)
+                if news_data.get('status') != 'error':
+                    self.news_cache.set(key, news_data)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, name='news-cache-refresh', daemon=True).start()
     
-    def fetch_news(self, query: str = None, category: str = None, language: str = 'en', page_size: int = 20) -> Dict:
+    def _fetch_news_upstream(self, query: str = None, category: str = None, language: str = 'en', page_size: int = 20,
+                             deadline: Optional[Deadline] = None) -> Dict:
         """Fetch news from News API"""
         base_url = "https://newsapi.org/v2"
         
@@ -109,33 +331,81 @@ class NewsService:
             if category and category.lower() != 'all':
                 params['category'] = category.lower()
         
+        kwargs = {}
+        shortened = False
+        if deadline is not None:
+            # One attempt, cut to the time left: retries and backoff would outlast the budget
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                return {"status": "error", "message": "Request deadline passed before fetching news"}
+            connect_timeout, read_timeout = self.http.timeout
+            kwargs['timeout'] = (min(connect_timeout, remaining), min(read_timeout, remaining))
+            kwargs['retry'] = False
+            shortened = remaining < max(connect_timeout, read_timeout)
+        
+        if not self._breaker_allows('newsapi'):
+            return {"status": "error", "message": "News API is temporarily unavailable"}
         try:
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, **kwargs)
             response.raise_for_status()
-            return response.json()
+            news_data = response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error fetching news: {e}")
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            self.metrics.inc('rate_limited_total' if status == 429 else 'upstream_errors_total', {'upstream': 'newsapi'})
+            # A timeout cut short by the caller's budget (budgetMs is client supplied) says nothing
+            # about the health of the API; only timeouts at the configured upstream timeout count
+            if status is None and shortened and deadline.expired():
+                return {"status": "error", "message": str(e)}
+            # Client errors such as a bad query say nothing about the health of the API
+            self._breaker_record('newsapi', status is not None and status < 500 and status != 429)
             return {"status": "error", "message": str(e)}
+        self._breaker_record('newsapi', True)
+        return news_data
     
     def summarize_article(self, title: str, description: str, content: str) -> str:
-        """Summarize an article using Gemini AI"""
+        """Summarize an article according to the summary tier"""
+        if self.summary_tier != 'llm':
+            return self.summarize_articles([{'title': title, 'description': description, 'content': content}])[0]
+        return self._summarize_llm(title, description, content)
+    
+    def _summarize_llm(self, title: str, description: str, content: str, coalesce: bool = True) -> str:
+        """Summarize an article using Gemini AI
+
+        ``coalesce=False`` is for callers that already hold this summary's
+        single-flight key (a coalesced batch).
+        """
         if not self.gemini_model:
-            # Fallback: create a simple summary from available text
-            if description and len(description) > 50:
-                # Take first 100 characters and add ellipsis
-                return description[:100] + "..." if len(description) > 100 else description
-            elif title:
-                return f"Article about: {title}"
-            else:
-                return "Summary unavailable"
+            self.metrics.inc('summary_fallbacks_total')
+            return self._fallback_summary(title, description, content)
         
+        cache_key = None
+        if self.summary_cache is not None:
+            cache_key = self._summary_cache_key(title, description, content)
+            cached_summary = self._get_cached_summary(cache_key)
+            self.metrics.inc('cache_requests_total', {
+                'cache': 'summary', 'result': 'miss' if cached_summary is None else 'hit'
+            })
+            if cached_summary is not None:
+                return cached_summary
+        
+        if self._circuit_open('gemini'):
+            self.metrics.inc('summary_fallbacks_total')
+            return self._fallback_summary(title, description, content)
+        
+        if coalesce and cache_key is not None and self.single_flight is not None:
+            # Concurrent requests for the same uncached summary share one Gemini call
+            return self.single_flight.do(
+                f"summary:{cache_key}",
+                lambda: self._summarize_uncached(title, description, content, cache_key),
+                check=lambda: self._get_cached_summary(cache_key)
+            )
+        return self._summarize_uncached(title, description, content, cache_key)
+    
+    def _summarize_uncached(self, title: str, description: str, content: str,
+                            cache_key: Optional[str] = None) -> str:
         try:
-            # Combine available text
-            article_text = f"Title: {title}\n"
-            if description:
-                article_text += f"Description: {description}\n"
-            if content and content != "[Removed]":
-                article_text += f"Content: {content}"
+            article_text = self._article_text(title, description, content)
             
             prompt = f"""
             Please provide a concise summary of this news article in 2-3 sentences:
@@ -145,92 +415,737 @@ class NewsService:
             Focus on the key facts and main points.
             """
             
-            response = self.gemini_model.generate_content(prompt)
-            return response.text.strip()
+            with self.metrics.timer('summarize'):
+                response = self._generate(prompt)
+            summary = LLMSummary(response.text.strip())
+            if cache_key is not None and summary:
+                self.summary_cache.set(cache_key, summary)
+            return summary
         
         except Exception as e:
-            error_msg = str(e)
-            if "429" in error_msg or "quota" in error_msg.lower() or "rate" in error_msg.lower():
+            if isinstance(e, CircuitOpen):
+                pass
+            elif self._is_rate_limit_error(e):
                 print(f"Rate limit/quota exceeded for Gemini API: {e}")
-                return f"AI summary temporarily unavailable (rate limit). Original description: {description}"
             else:
                 print(f"Error summarizing article: {e}")
+                self.metrics.inc('upstream_errors_total', {'upstream': 'gemini'})
             
-            # Fallback to simple summary
-            if description and len(description) > 50:
-                return description[:100] + "..." if len(description) > 100 else description
-            elif title:
-                return f"Article about: {title}"
-            else:
-                return "Summary unavailable"
+            self.metrics.inc('summary_fallbacks_total')
+            return self._fallback_summary(title, description, content)
+    
+    def _generate(self, prompt: str):
+        """Call Gemini through its circuit breaker and the shared rate limiter, retrying rate-limited calls"""
+        if not self._breaker_allows('gemini'):
+            raise CircuitOpen("Gemini circuit breaker is open")
+        try:
+            response = self._generate_limited(prompt)
+        except RateLimitExceeded:
+            # Our own limiter timing out is local back-pressure, not an upstream failure
+            raise
+        except Exception:
+            self._breaker_record('gemini', False)
+            raise
+        self._breaker_record('gemini', True)
+        return response
+    
+    def _generate_limited(self, prompt: str):
+        if self.gemini_limiter is None:
+            try:
+                return self.gemini_model.generate_content(prompt)
+            except Exception as e:
+                if self._is_rate_limit_error(e):
+                    self.metrics.inc('rate_limited_total', {'upstream': 'gemini'})
+                raise
+        
+        for attempt in range(self.gemini_max_attempts):
+            if not self.gemini_limiter.acquire():
+                raise RateLimitExceeded("Timed out waiting for a Gemini rate limiter token")
+            try:
+                response = self.gemini_model.generate_content(prompt)
+            except Exception as e:
+                if not self._is_rate_limit_error(e):
+                    raise
+                self.metrics.inc('rate_limited_total', {'upstream': 'gemini'})
+                self.gemini_limiter.record_rate_limited()
+                if attempt == self.gemini_max_attempts - 1:
+                    raise
+                continue
+            self.gemini_limiter.record_success()
+            return response
+    
+    def _breaker_allows(self, upstream: str) -> bool:
+        """Whether a call to ``upstream`` may go ahead (this may claim the half-open probe)"""
+        breaker = self.breakers.get(upstream)
+        if breaker is None or breaker.allow():
+            return True
+        self.metrics.inc('circuit_rejections_total', {'upstream': upstream})
+        return False
+    
+    def _circuit_open(self, upstream: str) -> bool:
+        """Whether calls to ``upstream`` are being refused, for skipping work that would only fall back"""
+        breaker = self.breakers.get(upstream)
+        if breaker is None or not breaker.is_open():
+            return False
+        self.metrics.inc('circuit_rejections_total', {'upstream': upstream})
+        return True
+    
+    def _breaker_record(self, upstream: str, success: bool):
+        breaker = self.breakers.get(upstream)
+        if breaker is None:
+            return
+        if success:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+    
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        if isinstance(error, RateLimitExceeded):
+            return True
+        error_msg = str(error).lower()
+        return "429" in error_msg or "quota" in error_msg or "rate" in error_msg
+    
+    def summarize_articles(self, articles: List[Dict]) -> List[str]:
+        """Summarize many articles with as few Gemini requests as possible
+
+        Each article is a dict with ``title``, ``description`` and ``content``.
+        Cached summaries are reused, the rest are packed into prompts bounded by
+        ``summary_batch_size`` articles and ``summary_batch_token_budget``
+        estimated input tokens. Entries missing or malformed in a batch reply
+        are retried one at a time. Summaries are returned in input order.
+        
+        In the 'local' tier every summary is extractive. In 'local_then_llm'
+        cache misses get an extractive summary now and are summarized by
+        Gemini in the background, so the cached LLM summary is served next time.
+        """
+        if self.summary_tier == 'local' or not self.gemini_model:
+            if self.summary_tier != 'local':
+                self.metrics.inc('summary_fallbacks_total', amount=len(articles))
+            with self.metrics.timer('summarize_local'):
+                return self.local_summarizer.summarize_many(articles)
+        
+        summaries = [None] * len(articles)
+        pending = []
+        for index, article in enumerate(articles):
+            if self.summary_cache is not None:
+                cached_summary = self._get_cached_summary(self._summary_cache_key(
+                    article.get('title'), article.get('description'), article.get('content')
+                ))
+                self.metrics.inc('cache_requests_total', {
+                    'cache': 'summary', 'result': 'miss' if cached_summary is None else 'hit'
+                })
+                if cached_summary is not None:
+                    summaries[index] = cached_summary
+                    continue
+            pending.append(index)
+        
+        if self.summary_tier == 'local_then_llm':
+            with self.metrics.timer('summarize_local'):
+                local_summaries = self.local_summarizer.summarize_many([articles[index] for index in pending])
+            for index, summary in zip(pending, local_summaries):
+                summaries[index] = summary
+            self._upgrade_summaries_async([articles[index] for index in pending])
+            return summaries
+        if pending and self._circuit_open('gemini'):
+            self.metrics.inc('summary_fallbacks_total', amount=len(pending))
+            with self.metrics.timer('summarize_local'):
+                local_summaries = self.local_summarizer.summarize_many([articles[index] for index in pending])
+            for index, summary in zip(pending, local_summaries):
+                summaries[index] = summary
+            return summaries
+        return self._summarize_pending(articles, summaries, pending)
+    
+    def _summarize_pending(self, articles: List[Dict], summaries: List[Optional[str]],
+                           pending: List[int]) -> List[str]:
+        """Fill in the summaries at the ``pending`` indexes with Gemini, batched where possible
+
+        Batches are coalesced per summary, with the same single-flight keys as
+        ``_summarize_llm``: summaries another request (or worker) is already
+        generating are awaited rather than requested again.
+        """
+        if self.single_flight is None or self.summary_cache is None:
+            return self._summarize_batches(articles, summaries, pending, coalesce=True)
+        
+        cache_keys = {}
+        by_flight_key = {}
+        for index in pending:
+            article = articles[index]
+            cache_keys[index] = self._summary_cache_key(
+                article.get('title'), article.get('description'), article.get('content')
+            )
+            by_flight_key.setdefault(f"summary:{cache_keys[index]}", index)
+        
+        def summarize_owned(flight_keys: List[str]) -> Dict[str, str]:
+            owned = [by_flight_key[flight_key] for flight_key in flight_keys]
+            owned_summaries = self._summarize_batches(articles, [None] * len(articles), owned, coalesce=False)
+            return {flight_key: owned_summaries[by_flight_key[flight_key]] for flight_key in flight_keys}
+        
+        results = self.single_flight.do_many(
+            list(by_flight_key), summarize_owned,
+            check=lambda flight_key: self._get_cached_summary(flight_key[len('summary:'):])
+        )
+        for index in pending:
+            summaries[index] = results[f"summary:{cache_keys[index]}"]
+        return summaries
+    
+    def _summarize_batches(self, articles: List[Dict], summaries: List[Optional[str]],
+                           pending: List[int], coalesce: bool) -> List[str]:
+        batches = self._plan_summary_batches(articles, pending)
+        if len(batches) > 1:
+            results = list(self.executor.map(lambda batch: self._summarize_batch(articles, batch), batches))
+        else:
+            results = [self._summarize_batch(articles, batch) for batch in batches]
+        for batch_result in results:
+            for index, summary in batch_result.items():
+                summaries[index] = summary
+        
+        for index in pending:
+            if summaries[index] is None:
+                article = articles[index]
+                summaries[index] = self._summarize_llm(
+                    article.get('title'), article.get('description'), article.get('content'), coalesce
+                )
+        return summaries
+    
+    def _upgrade_summaries_async(self, articles: List[Dict]):
+        """Summarize articles with Gemini in the background so the summary cache is filled
+
+        Without a summary cache there is nowhere to keep the results, so this
+        does nothing. Articles already being upgraded are skipped.
+        """
+        if self.summary_cache is None or not articles or self._circuit_open('gemini'):
+            return
+        keys = [
+            self._summary_cache_key(article.get('title'), article.get('description'), article.get('content'))
+            for article in articles
+        ]
+        with self._upgrade_lock:
+            selected = [(key, article) for key, article in zip(keys, articles) if key not in self._upgrading]
+            self._upgrading.update(key for key, _ in selected)
+        if not selected:
+            return
+        
+        def upgrade():
+            try:
+                upgrade_articles = [article for _, article in selected]
+                self._summarize_pending(
+                    upgrade_articles, [None] * len(upgrade_articles), list(range(len(upgrade_articles)))
+                )
+            except Exception as e:
+                print(f"Error upgrading summaries: {e}")
+            finally:
+                with self._upgrade_lock:
+                    self._upgrading.difference_update(key for key, _ in selected)
+        
+        threading.Thread(target=upgrade, name='summary-upgrade', daemon=True).start()
+    
+    def _plan_summary_batches(self, articles: List[Dict], indexes: List[int]) -> List[List[int]]:
+        """Group article indexes into batches within the size and token budget"""
+        batches = []
+        current = []
+        current_tokens = 0
+        for index in indexes:
+            article = articles[index]
+            # Rough estimate: about four characters per token
+            tokens = len(self._article_text(
+                article.get('title'), article.get('description'), article.get('content')
+            )) // 4 + 1
+            if current and (len(current) >= self.summary_batch_size
+                            or current_tokens + tokens > self.summary_batch_token_budget):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _summarize_batch(self, articles: List[Dict], indexes: List[int]) -> Dict[int, str]:
+        """Summarize one batch in a single request
+
+        Returns only the valid entries of the reply, leaving missing or
+        malformed ones to be retried per article. If the request itself fails,
+        every article gets a local summary instead (which is not cached).
+        """
+        if len(indexes) == 1:
+            # Nothing to amortize; the per-article fallback will handle it
+            return {}
+        
+        sections = []
+        for index in indexes:
+            article = articles[index]
+            sections.append(f"[id: {index}]\n" + self._article_text(
+                article.get('title'), article.get('description'), article.get('content')
+            ))
+        prompt = (
+            "Provide a concise summary of each of the following news articles in 2-3 sentences, "
+            "focusing on the key facts and main points.\n"
+            "Respond with only a JSON object that maps each article id to its summary, "
+            'for example {"3": "Summary of article 3."}.\n\n'
+            + "\n\n".join(sections)
+        )
+        
+        try:
+            with self.metrics.timer('summarize_batch'):
+                response = self._generate(prompt)
+            parsed = self._parse_batch_response(response.text)
+        except Exception as e:
+            if not isinstance(e, CircuitOpen):
+                print(f"Error summarizing article batch: {e}")
+                if not self._is_rate_limit_error(e):
+                    self.metrics.inc('upstream_errors_total', {'upstream': 'gemini'})
+            # Retrying each article would repeat the failed call many times over
+            self.metrics.inc('summary_fallbacks_total', amount=len(indexes))
+            local_summaries = self.local_summarizer.summarize_many([articles[index] for index in indexes])
+            return dict(zip(indexes, local_summaries))
+        
+        results = {}
+        for index in indexes:
+            summary = parsed.get(str(index))
+            if not isinstance(summary, str) or not summary.strip():
+                continue
+            summary = LLMSummary(summary.strip())
+            results[index] = summary
+            if self.summary_cache is not None:
+                article = articles[index]
+                self.summary_cache.set(self._summary_cache_key(
+                    article.get('title'), article.get('description'), article.get('content')
+                ), summary)
+        return results
+    
+    @staticmethod
+    def _parse_batch_response(text: str) -> Dict:
+        """Extract the JSON object from a batch reply, tolerating code fences"""
+        text = (text or '').strip()
+        start = text.find('{')
+        end = text.rfind('}')
+        if start == -1 or end <= start:
+            return {}
+        try:
+            parsed = json.loads(text[start:end + 1])
+        except ValueError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    
+    def _summary_cache_key(self, title: str, description: str, content: str) -> str:
+        return SummaryCache.make_key(
+            getattr(self.gemini_model, 'model_name', ''), SUMMARY_PROMPT_VERSION,
+            title, description, content
+        )
+    
+    @staticmethod
+    def _article_text(title: str, description: str, content: str) -> str:
+        """Combine available article text for a prompt"""
+        article_text = f"Title: {title}\n"
+        if description:
+            article_text += f"Description: {description}\n"
+        if content and content != "[Removed]":
+            article_text += f"Content: {content}"
+        return article_text
+    
+    def _fallback_summary(self, title: str, description: str, content: Optional[str] = None) -> str:
+        """Create a local extractive summary from available text"""
+        return self.local_summarizer.summarize(title, description, content)
+    
+    def _cached_summary(self, title: str, description: str, content: str) -> Optional[str]:
+        if self.summary_cache is None or self.summary_tier == 'local' or not self.gemini_model:
+            return None
+        return self._get_cached_summary(self._summary_cache_key(title, description, content))
+    
+    def _get_cached_summary(self, cache_key: str) -> Optional[LLMSummary]:
+        # Only Gemini summaries are ever cached
+        summary = self.summary_cache.get(cache_key)
+        return None if summary is None else LLMSummary(summary)
     
     def translate_text(self, text: str, target_language: str = 'en') -> str:
         """Translate text using Google Translate (if available)"""
+        return self.translate_texts([text], target_language)[0]
+    
+    def translate_texts(self, texts: List[str], target_language: str = 'en',
+                        source_language: Optional[str] = None) -> List[str]:
+        """Translate many strings with as few Google Translate calls as possible
+
+        Empty strings are passed through, duplicates are translated once, and
+        cached translations are reused. Anything that fails to translate is
+        returned unchanged, in input order. Without ``source_language`` Google
+        detects the source (feeds can be in any NewsAPI language).
+        """
         if not self.translate_client:
-            return text  # Return original text if translation not available
+            return list(texts)  # Return original text if translation not available
+        
+        unique = list(dict.fromkeys(text for text in texts if text))
+        translations = {}
+        
+        keys = {}
+        if self.translation_cache is not None and unique:
+            keys = {
+                text: self.translation_cache.make_key(text, source_language, target_language) for text in unique
+            }
+            cached = self.translation_cache.get_many(list(keys.values()))
+            translations = {text: cached[key] for text, key in keys.items() if key in cached}
+            self.metrics.inc('cache_requests_total', {'cache': 'translation', 'result': 'hit'}, len(translations))
+            self.metrics.inc(
+                'cache_requests_total', {'cache': 'translation', 'result': 'miss'}, len(unique) - len(translations)
+            )
+        
+        pending = [text for text in unique if text not in translations]
+        fresh = {}
+        for start in range(0, len(pending), self.translate_batch_size):
+            chunk = pending[start:start + self.translate_batch_size]
+            if not self._breaker_allows('translate'):
+                # Leave the rest untranslated rather than wait on a failing API
+                break
+            try:
+                # Handle different client types
+                if hasattr(self.translate_client, 'translate'):
+                    # Old client accepts a list and returns one result per input
+                    with self.metrics.timer('translate', language=language_label(target_language)):
+                        results = self.translate_client.translate(
+                            chunk, target_language=target_language, source_language=source_language
+                        )
+                    for text, result in zip(chunk, results):
+                        fresh[text] = result['translatedText']
+                    self._breaker_record('translate', True)
+                else:
+                    # New client - would need different implementation
+                    print("New Google Translate client not fully implemented")
+                    break
+            except Exception as e:
+                print(f"Translation error: {e}")
+                self.metrics.inc(
+                    'rate_limited_total' if self._is_rate_limit_error(e) else 'upstream_errors_total',
+                    {'upstream': 'translate'}
+                )
+                self._breaker_record('translate', False)
+        
+        translations.update(fresh)
+        if self.translation_cache is not None and fresh:
+            self.translation_cache.set_many({keys[text]: translation for text, translation in fresh.items()})
+        return [translations.get(text, text) if text else text for text in texts]
+    
+    def translate_articles(self, processed_articles: List[Dict], translate_to: Optional[str],
+                           deadline: Optional[Deadline] = None):
+        """Add translated fields to processed articles with one batched translation
+
+        If ``deadline`` passes first the articles are left untranslated and
+        flagged with 'translation' in ``pending``; the translation finishes in
+        the background and fills the translation cache.
+        """
+        if not (translate_to and self.translate_client and translate_to != 'en'):
+            return
+        if deadline is not None:
+            copies = [dict(processed_article) for processed_article in processed_articles]
             
-        try:
-            # Handle different client types
-            if hasattr(self.translate_client, 'translate'):
-                # Old client
-                result = self.translate_client.translate(text, target_language=target_language)
-                return result['translatedText']
+            def translate_copies():
+                self.translate_articles(copies, translate_to)
+                return True
+            
+            if run_within(deadline, translate_copies, lambda: False, self.executor):
+                for processed_article, copy in zip(processed_articles, copies):
+                    processed_article.update(copy)
             else:
-                # New client - would need different implementation
-                print("New Google Translate client not fully implemented")
-                return text
+                for processed_article in processed_articles:
+                    processed_article['pending'] = processed_article.get('pending', []) + ['translation']
+            return
+        
+        texts = []
+        for processed_article in processed_articles:
+            texts.append(processed_article.get('title'))
+            texts.append(processed_article.get('description'))
+            texts.append(processed_article.get('summary'))
+        try:
+            translations = self.translate_texts(texts, translate_to)
         except Exception as e:
             print(f"Translation error: {e}")
-            return text
+            return
+        
+        for offset, processed_article in enumerate(processed_articles):
+            title, description, summary = translations[offset * 3:offset * 3 + 3]
+            processed_article['translated_title'] = title
+            processed_article['translatedDescription'] = description
+            if processed_article.get('summary'):
+                processed_article['translated_summary'] = summary
+            # Mark that this article was translated from English
+            processed_article['originalLanguage'] = 'en'
     
-    def process_news_data(self, news_data: Dict, summarize: bool = True, translate_to: str = None) -> Dict:
-        """Process and enhance news data"""
+    def process_news_data(self, news_data: Dict, summarize: bool = True, translate_to: str = None,
+                          concurrent: Optional[bool] = None, category: Optional[str] = None,
+                          record: bool = True, deadline: Optional[Deadline] = None) -> Dict:
+        """Process and enhance news data
+
+        With ``concurrent`` (the default when the service has a concurrency
+        limit above 1) articles are enriched on the shared thread pool. Order
+        is preserved and a failure in one article never affects the others.
+        Unless ``record`` is False, processed articles are stored and added to
+        the search index under ``category``.
+
+        With a ``deadline`` whatever is not ready in time is returned with a
+        cached or local summary and/or untranslated, listing the missing
+        fields in ``pending``, and the result is marked ``partial``; the
+        remaining work completes in the background and fills the caches.
+        """
         if news_data.get('status') == 'error':
             return news_data
         
+        started = time.perf_counter()
         articles = news_data.get('articles', [])
+        if concurrent is None:
+            concurrent = self.concurrency > 1
+        if deadline is not None:
+            # Only pool work can be abandoned when time runs out
+            concurrent = True
+        
+        # Near-duplicates of an article summarized in this page, or recently, reuse its summary.
+        # An article with a summary of its own in the shared cache keeps it, so every worker
+        # serves the same summary whatever its in-memory clusters look like
+        clusters = self._cluster_articles(articles) if summarize else [None] * len(articles)
+        leaders = {}
+        pending = []
+        for index, cluster_id in enumerate(clusters):
+            article = articles[index]
+            if cluster_id is None or self._cached_summary(
+                article.get('title'), article.get('description'), article.get('content')
+            ) is not None:
+                pending.append(index)
+            elif cluster_id not in leaders and self.duplicate_index.get_summary(cluster_id) is None:
+                leaders[cluster_id] = index
+                pending.append(index)
+        
+        processed_articles = [None] * len(articles)
+        unique = [articles[index] for index in pending]
+        if concurrent and (len(unique) > 1 or deadline is not None):
+            for offset, processed_article in self._iter_groups(unique, summarize, None, deadline):
+                processed_articles[pending[offset]] = processed_article
+        else:
+            for group in self._plan_article_groups(unique, summarize):
+                for offset, processed_article in self._process_group(unique, group, summarize, None):
+                    processed_articles[pending[offset]] = processed_article
+        
+        for index, cluster_id in enumerate(clusters):
+            if cluster_id is None:
+                continue
+            if processed_articles[index] is None:
+                # Remembered cluster summaries are always Gemini's
+                summary = self.duplicate_index.get_summary(cluster_id)
+                summary = None if summary is None else LLMSummary(summary)
+                leader = None if summary is not None else processed_articles[leaders[cluster_id]]
+                if leader is not None:
+                    summary = leader.get('summary')
+                if not isinstance(summary, LLMSummary):
+                    # A local summary of the leader's text is no summary of this article
+                    article = articles[index]
+                    summary = self._fallback_summary(
+                        article.get('title'), article.get('description'), article.get('content')
+                    )
+                processed_articles[index] = self._process_article(articles[index], summarize, summary)
+                if leader is not None and leader.get('pending'):
+                    processed_articles[index]['pending'] = list(leader['pending'])
+                else:
+                    self._keep_cluster_summary(articles[index], summary)
+            elif leaders.get(cluster_id) == index:
+                self._remember_cluster_summary(cluster_id, processed_articles[index])
+        
+        # Cluster ids are taken from the page (the smallest member article id), not from this
+        # worker's in-memory index, so they are the same whichever worker builds the page
+        page_cluster_ids = {}
+        for index, cluster_id in enumerate(clusters):
+            if cluster_id is not None:
+                article_id = processed_articles[index]['id']
+                page_cluster_ids[cluster_id] = min(page_cluster_ids.get(cluster_id, article_id), article_id)
+        for index, cluster_id in enumerate(clusters):
+            if cluster_id is not None:
+                processed_articles[index]['clusterId'] = page_cluster_ids[cluster_id]
+        
+        # Translate the whole page in one batch once every summary is in
+        self.translate_articles(processed_articles, translate_to, deadline)
+        if record:
+            self.record_articles(processed_articles, category, translate_to)
+        self.metrics.observe('stage_duration_seconds', time.perf_counter() - started, {
+            'stage': 'process', 'category': category_label(category), 'language': language_label(translate_to)
+        })
+        
+        result = {
+            'status': 'ok',
+            'totalResults': news_data.get('totalResults', len(processed_articles)),
+            'articles': processed_articles
+        }
+        if any(processed_article.get('pending') for processed_article in processed_articles):
+            result['partial'] = True
+        return result
+    
+    def _cluster_articles(self, articles: List[Dict]) -> List[Optional[str]]:
+        """Near-duplicate cluster id per raw article, or all None without a duplicate index"""
+        if self.duplicate_index is None:
+            return [None] * len(articles)
+        try:
+            return self.duplicate_index.cluster([self._base_article(article) for article in articles])
+        except Exception as e:
+            print(f"Duplicate detection error: {e}")
+            return [None] * len(articles)
+    
+    def _remember_cluster_summary(self, cluster_id: str, processed_article: Dict):
+        """Share a cluster leader's summary with later duplicates, if Gemini wrote it"""
+        summary = processed_article.get('summary')
+        if summary and isinstance(summary, LLMSummary):
+            self.duplicate_index.set_summary(cluster_id, summary)
+    
+    def _keep_cluster_summary(self, article: Dict, summary: Optional[str]):
+        """Cache a Gemini summary shared from a near-duplicate under the article's own key
+
+        Only in the 'llm' tier; the local tiers leave the summary cache to
+        summaries generated for the article itself.
+        """
+        if not summary or not isinstance(summary, LLMSummary) or self.summary_cache is None:
+            return
+        if self.summary_tier != 'llm' or not self.gemini_model:
+            return
+        title, description, content = article.get('title'), article.get('description'), article.get('content')
+        self.summary_cache.set(self._summary_cache_key(title, description, content), summary)
+    
+    def prepare_articles(self, news_data: Dict) -> List[Dict]:
+        """Convert raw NewsAPI articles to the API shape without any enrichment"""
+        return [self._base_article(article) for article in news_data.get('articles', [])]
+    
+    def iter_processed_articles(self, news_data: Dict, summarize: bool = True, translate_to: str = None,
+                                category: Optional[str] = None) -> Iterator[Tuple[int, Dict]]:
+        """Yield (index, processed_article) pairs as soon as each one is enriched
+
+        Articles sharing a summary batch complete together; completion order is
+        otherwise unspecified. The page is indexed for search once it is done.
+        """
         processed_articles = []
+        for index, processed_article in self._iter_groups(news_data.get('articles', []), summarize, translate_to):
+            processed_articles.append(processed_article)
+            yield index, processed_article
+        self.record_articles(processed_articles, category, translate_to)
+    
+    def record_articles(self, processed_articles: List[Dict], category: Optional[str] = None,
+                        translate_to: Optional[str] = None):
+        """Add processed articles to the article store and local search index, if configured
+
+        Articles still missing enrichment (``pending``) are skipped.
+        """
+        processed_articles = [article for article in processed_articles if not article.get('pending')]
+        if not processed_articles:
+            return
+        if self.article_store is not None:
+            try:
+                self.article_store.put_many(processed_articles, translate_to)
+            except Exception as e:
+                print(f"Error storing articles: {e}")
+        if self.article_index is not None:
+            try:
+                self.article_index.add_articles(processed_articles, category.lower() if category else None)
+            except Exception as e:
+                print(f"Error indexing articles: {e}")
+    
+    def _iter_groups(self, articles: List[Dict], summarize: bool, translate_to: Optional[str],
+                     deadline: Optional[Deadline] = None) -> Iterator[Tuple[int, Dict]]:
+        futures = {
+            self.executor.submit(self._process_group, articles, group, summarize, translate_to): group
+            for group in self._plan_article_groups(articles, summarize)
+        }
+        yielded = set()
+        try:
+            for future in as_completed(futures, timeout=None if deadline is None else deadline.remaining()):
+                yielded.add(future)
+                for index, processed_article in future.result():
+                    yield index, processed_article
+        except FuturesTimeoutError:
+            # Out of time: serve what is ready and let the rest finish in the background
+            for future, group in futures.items():
+                if future in yielded:
+                    continue
+                if future.done() and future.exception() is None:
+                    for index, processed_article in future.result():
+                        yield index, processed_article
+                    continue
+                for index in group:
+                    yield index, self._partial_article(articles[index], summarize)
+    
+    def _plan_article_groups(self, articles: List[Dict], summarize: bool) -> List[List[int]]:
+        """Split article indexes into units of work, one summary batch each"""
+        if not (summarize and self.gemini_model and self.summary_batch_size > 1):
+            return [[index] for index in range(len(articles))]
+        titled = [index for index, article in enumerate(articles) if article.get('title')]
+        groups = self._plan_summary_batches(articles, titled)
+        grouped = set(titled)
+        groups.extend([index] for index in range(len(articles)) if index not in grouped)
+        return groups
+    
+    def _process_group(self, articles: List[Dict], group: List[int], summarize: bool,
+                       translate_to: Optional[str]) -> List[Tuple[int, Dict]]:
+        """Summarize a group in one batch where possible, then finish each article"""
+        summaries = [None] * len(group)
+        batched = self.summary_tier != 'llm' or (self.gemini_model and self.summary_batch_size > 1)
+        if summarize and batched and len(group) > 1:
+            try:
+                summaries = self.summarize_articles([articles[index] for index in group])
+            except Exception as e:
+                print(f"Error summarizing article batch: {e}")
+        processed_articles = [
+            self._process_article(articles[index], summarize, summary)
+            for index, summary in zip(group, summaries)
+        ]
+        self.translate_articles(processed_articles, translate_to)
+        return list(zip(group, processed_articles))
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Bounded pool shared by all requests, so upstream concurrency stays capped"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.concurrency, thread_name_prefix='news-enrich'
+                    )
+        return self._executor
+    
+    @staticmethod
+    def _base_article(article: Dict) -> Dict:
+        return {
+            'id': article_id(article.get('url', '')),
+            'title': article.get('title', ''),
+            'description': article.get('description', ''),
+            'url': article.get('url', ''),
+            'urlToImage': article.get('urlToImage'),
+            'publishedAt': article.get('publishedAt'),
+            'source': (article.get('source') or {}).get('name', 'Unknown'),
+            'content': article.get('content', ''),
+            'originalLanguage': 'en'  # Default to English, will be updated if translation is applied
+        }
+    
+    def _partial_article(self, article: Dict, summarize: bool) -> Dict:
+        """An article whose enrichment is still running, with the best summary available now"""
+        processed_article = self._base_article(article)
+        if summarize and processed_article['title']:
+            title, description, content = article.get('title'), article.get('description'), article.get('content')
+            cached_summary = self._cached_summary(title, description, content)
+            if cached_summary is not None:
+                processed_article['summary'] = cached_summary
+            else:
+                self.metrics.inc('summary_fallbacks_total')
+                processed_article['summary'] = self._fallback_summary(title, description, content)
+                processed_article['pending'] = ['summary']
+        return processed_article
+    
+    def _process_article(self, article: Dict, summarize: bool, summary: Optional[str] = None) -> Dict:
+        """Build one processed article; summary errors leave the article un-enriched"""
+        processed_article = self._base_article(article)
         
-        for article in articles:
-            processed_article = {
-                'id': article.get('url', ''),  # Use URL as ID for now
-                'title': article.get('title', ''),
-                'description': article.get('description', ''),
-                'url': article.get('url', ''),
-                'urlToImage': article.get('urlToImage'),
-                'publishedAt': article.get('publishedAt'),
-                'source': article.get('source', {}).get('name', 'Unknown'),
-                'content': article.get('content', ''),
-                'originalLanguage': 'en'  # Default to English, will be updated if translation is applied
-            }
-            
+        try:
             # Add summary if requested
-            if summarize and processed_article['title']:
+            if summarize and summary is not None:
+                processed_article['summary'] = summary
+            elif summarize and processed_article['title']:
                 processed_article['summary'] = self.summarize_article(
                     processed_article['title'],
                     processed_article['description'],
                     processed_article['content']
                 )
-            
-            # Add translation if requested and available
-            if translate_to and self.translate_client and translate_to != 'en':
-                processed_article['translated_title'] = self.translate_text(
-                    processed_article['title'], translate_to
-                )
-                processed_article['translatedDescription'] = self.translate_text(
-                    processed_article['description'], translate_to
-                )
-                if processed_article.get('summary'):
-                    processed_article['translated_summary'] = self.translate_text(
-                        processed_article['summary'], translate_to
-                    )
-                # Mark that this article was translated from English
-                processed_article['originalLanguage'] = 'en'
-            
-            processed_articles.append(processed_article)
+        except Exception as e:
+            print(f"Error processing article {processed_article['url']}: {e}")
         
-        return {
-            'status': 'ok',
-            'totalResults': news_data.get('totalResults', len(processed_articles)),
-            'articles': processed_articles
-        }
\ No newline at end of file
+        return processed_article
@@ -0,0 +1,137 @@
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from feed_service import FeedService
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows development machines: every process acts as leader
+    FCNTL_AVAILABLE = False
+
+
+class LeaderLock:
+    """Non-blocking, process-wide exclusive lock on a local file.
+
+    The OS releases the lock when the holding process exits, so another
+    worker can take over leadership on its next attempt.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    @property
+    def held(self) -> bool:
+        return self._file is not None
+
+    def try_acquire(self) -> bool:
+        if self._file is not None:
+            return True
+        if not FCNTL_AVAILABLE:
+            self._file = True
+            return True
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        lock_file = open(self.path, 'a+')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+
+class PrefetchScheduler:
+    """Keeps configured feeds warm by refreshing them ahead of expiry.
+
+    Every worker starts the scheduler thread, but only the one holding the
+    leader lock refreshes; the others keep retrying the lock so leadership
+    moves on if the leader dies.
+    """
+
+    def __init__(self, feed_service: FeedService, keys: List[Tuple[str, str, str]], lock_path: str,
+                 interval: float = 240, jitter: float = 30):
+        self.feed_service = feed_service
+        self.keys = keys
+        self.interval = interval
+        self.jitter = jitter
+        self.lock = LeaderLock(lock_path)
+        self.last_errors = {}
+        self._thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='feed-prefetch', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        # Spread worker start-up so they do not all contend at boot
+        self._stop.wait(random.uniform(0, min(self.jitter, 5)))
+        while not self._stop.is_set():
+            if self.lock.try_acquire():
+                self.refresh_all()
+            self._stop.wait(self.interval + random.uniform(-self.jitter, self.jitter))
+
+    def refresh_all(self):
+        """Refresh every configured key, one at a time"""
+        for category, language, user_language in self.keys:
+            if self._stop.is_set():
+                return
+            key = self.feed_service.make_key(category, language, user_language)
+            try:
+                feed = self.feed_service.refresh(category, language, user_language)
+                if feed.get('status') == 'error':
+                    self.last_errors[key] = feed.get('message')
+                else:
+                    self.last_errors.pop(key, None)
+            except Exception as e:
+                print(f"Error prefetching feed {key}: {e}")
+                self.last_errors[key] = str(e)
+
+    def status(self) -> Dict:
+        """Last refresh time per configured key, read from the shared feed store"""
+        try:
+            updated = self.feed_service.store.updated_times()
+        except Exception:
+            updated = {}
+        now = time.time()
+        keys = {}
+        for category, language, user_language in self.keys:
+            key = self.feed_service.make_key(category, language, user_language)
+            updated_at = updated.get(key)
+            keys[key] = {
+                'lastRefresh': updated_at,
+                'age': round(now - updated_at, 1) if updated_at else None,
+                'lastError': self.last_errors.get(key)
+            }
+        return {
+            'leader': self.lock.held,
+            'interval': self.interval,
+            'keys': keys
+        }
+
+
+def parse_prefetch_keys(categories: str, languages: str, user_languages: str) -> List[Tuple[str, str, str]]:
+    """Expand comma-separated settings into every (category, language, userLanguage) combination"""
+    def split(value: Optional[str]) -> List[str]:
+        return [item.strip() for item in (value or '').split(',') if item.strip()]
+    return [
+        (category, language, user_language)
+        for category in split(categories)
+        for language in split(languages)
+        for user_language in split(user_languages)
+    ]
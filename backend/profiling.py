@@ -0,0 +1,158 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Tuple
+
+# Profiling modes: deterministic cProfile of the request thread, or sampling of every thread
+PROFILE_MODES = ('cprofile', 'sample')
+
+
+class CProfileSession:
+    """cProfile of the thread that handles the request; exported as pstats"""
+
+    extension = '.pstats'
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def write(self, path: str):
+        self.profile.dump_stats(path)
+
+    def report(self) -> Tuple[str, str]:
+        """(body, mimetype) for an inline report: the top functions by cumulative time"""
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats('cumulative').print_stats(60)
+        return out.getvalue(), 'text/plain'
+
+
+class SamplingSession:
+    """Samples the stacks of every thread (including the enrichment pool); exported as speedscope JSON"""
+
+    extension = '.speedscope.json'
+
+    def __init__(self, name: str, interval: float = 0.005):
+        self.name = name
+        self.interval = interval
+        self.samples = {}  # thread id -> list of (stack, weight)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        stopped = False
+        while not stopped:
+            # Always take a final sample, so even very short requests are represented
+            stopped = self._stop.wait(self.interval)
+            now = time.perf_counter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples.setdefault(thread_id, []).append((stack, now - last))
+            last = now
+
+    def speedscope(self) -> Dict:
+        frames = []
+        frame_index = {}
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        profiles = []
+        for thread_id, samples in self.samples.items():
+            stacks = []
+            for stack, _ in samples:
+                indexes = []
+                for frame in stack:
+                    if frame not in frame_index:
+                        frame_index[frame] = len(frames)
+                        frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+                    indexes.append(frame_index[frame])
+                stacks.append(indexes)
+            weights = [weight for _, weight in samples]
+            profiles.append({
+                'type': 'sampled',
+                'name': names.get(thread_id, str(thread_id)),
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': stacks,
+                'weights': weights
+            })
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': self.name,
+            'exporter': 'newsdigest',
+            'activeProfileIndex': 0,
+            'shared': {'frames': frames},
+            'profiles': profiles
+        }
+
+    def write(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.speedscope(), f)
+
+    def report(self) -> Tuple[str, str]:
+        return json.dumps(self.speedscope()), 'application/json'
+
+
+class RequestProfiler:
+    """Creates per-request profiling sessions, at most ``max_per_minute`` per process"""
+
+    def __init__(self, output_dir: str, max_per_minute: int = 6, sample_interval: float = 0.005):
+        self.output_dir = output_dir
+        self.max_per_minute = max_per_minute
+        self.sample_interval = sample_interval
+        self._recent = deque()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Take one slot of the per-process rate cap, if any is free"""
+        now = time.time()
+        with self._lock:
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+            if len(self._recent) >= self.max_per_minute:
+                return False
+            self._recent.append(now)
+            return True
+
+    def session(self, mode: str, name: str):
+        if mode == 'sample':
+            return SamplingSession(name, self.sample_interval)
+        return CProfileSession()
+
+    def save(self, session, name: str) -> str:
+        """Write a finished session to the output directory and return the file name"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+        now = time.time()
+        filename = (
+            f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}"
+            f"-{os.getpid()}-{safe_name}{session.extension}"
+        )
+        session.write(os.path.join(self.output_dir, filename))
+        return filename
@@ -0,0 +1,153 @@
+import random
+import threading
+import time
+from typing import Optional
+
+from sqlite_store import SQLiteStore
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call could not get a rate limiter token in time"""
+
+
+class AdaptiveRateLimiter(SQLiteStore):
+    """Token bucket shared by all workers through a SQLite row.
+
+    The refill rate adapts AIMD-style: every rate-limited response halves it
+    and blocks the bucket for an exponentially growing, jittered backoff,
+    while every success adds ``increase_step`` back up to ``max_rate``.
+    Callers wait for a token instead of being rejected.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS rate_buckets (
+            name TEXT PRIMARY KEY,
+            rate REAL NOT NULL,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            blocked_until REAL NOT NULL,
+            failures INTEGER NOT NULL
+        )''',
+    )
+
+    def __init__(self, path: str, name: str = 'gemini', max_rate: float = 1.0, min_rate: float = 0.05,
+                 burst: float = 5, increase_step: float = 0.05, decrease_factor: float = 0.5,
+                 base_backoff: float = 1.0, max_backoff: float = 60.0, max_wait: float = 20.0):
+        super().__init__(path)
+        self.name = name
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_wait
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+        self.conn.execute(
+            'INSERT OR IGNORE INTO rate_buckets (name, rate, tokens, updated_at, blocked_until, failures) '
+            'VALUES (?, ?, ?, ?, 0, 0)',
+            (name, max_rate, burst, time.time())
+        )
+
+    def _update(self, fn):
+        """Apply fn(state, now) -> (result, new_state) to the bucket atomically"""
+        conn = self.conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT rate, tokens, updated_at, blocked_until, failures FROM rate_buckets WHERE name = ?',
+                (self.name,)
+            ).fetchone()
+            now = time.time()
+            rate, tokens, updated_at, blocked_until, failures = row
+            rate = min(max(rate, self.min_rate), self.max_rate)
+            tokens = min(self.burst, tokens + max(0.0, now - updated_at) * rate)
+            result, state = fn([rate, tokens, now, blocked_until, failures], now)
+            conn.execute(
+                'UPDATE rate_buckets SET rate = ?, tokens = ?, updated_at = ?, blocked_until = ?, failures = ? '
+                'WHERE name = ?',
+                (*state, self.name)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return result
+
+    def _try_take(self) -> float:
+        """Take a token if one is available; otherwise return seconds to wait"""
+        def take(state, now):
+            rate, tokens, _, blocked_until, _ = state
+            if now < blocked_until:
+                return blocked_until - now, state
+            if tokens >= 1:
+                state[1] = tokens - 1
+                return 0.0, state
+            return (1 - tokens) / rate, state
+        return self._update(take)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is available; False if ``timeout`` passes first"""
+        timeout = self.max_wait if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._waiting_lock:
+            self._waiting += 1
+        try:
+            while True:
+                try:
+                    wait = self._try_take()
+                except Exception as e:
+                    # Never block upstream calls on a limiter storage problem
+                    print(f"Rate limiter error: {e}")
+                    return True
+                if wait <= 0:
+                    return True
+                # Jitter so waiting workers do not all wake at the same instant
+                wait += random.uniform(0, min(wait, 1.0) * 0.2)
+                if time.monotonic() + wait > deadline:
+                    return False
+                time.sleep(wait)
+        finally:
+            with self._waiting_lock:
+                self._waiting -= 1
+
+    def record_success(self):
+        def succeed(state, now):
+            state[0] = min(self.max_rate, state[0] + self.increase_step)
+            state[4] = 0
+            return None, state
+        self._safe_update(succeed)
+
+    def record_rate_limited(self):
+        def back_off(state, now):
+            failures = state[4] + 1
+            backoff = min(self.max_backoff, self.base_backoff * 2 ** (failures - 1))
+            state[0] = max(self.min_rate, state[0] * self.decrease_factor)
+            state[1] = 0.0
+            state[3] = max(state[3], now + random.uniform(backoff / 2, backoff))
+            state[4] = failures
+            return None, state
+        self._safe_update(back_off)
+
+    def _safe_update(self, fn):
+        try:
+            self._update(fn)
+        except Exception as e:
+            print(f"Rate limiter error: {e}")
+
+    def stats(self) -> dict:
+        try:
+            state = self._update(lambda state, now: (list(state), state))
+        except Exception as e:
+            return {'error': str(e), 'queueDepth': self._waiting}
+        rate, tokens, now, blocked_until, failures = state
+        return {
+            'rate': round(rate, 4),
+            'maxRate': self.max_rate,
+            'tokens': round(tokens, 2),
+            'blockedFor': round(max(0.0, blocked_until - now), 2),
+            'consecutiveRateLimits': failures,
+            'queueDepth': self._waiting
+        }
@@ -0,0 +1,81 @@
+import gzip
+import hashlib
+import json
+from typing import Callable, Dict, Hashable, Optional
+
+from flask import Response
+
+from cache import TTLCache
+from metrics import Metrics, NullMetrics
+
+# Optional fast JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Brotli compression
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+def dumps(payload) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+class EncodedBody:
+    """A serialized JSON body in every content-coding we can serve"""
+
+    def __init__(self, raw: bytes):
+        self.etag = hashlib.sha256(raw).hexdigest()[:32]
+        self.encodings = {
+            'identity': raw,
+            'gzip': gzip.compress(raw, compresslevel=9, mtime=0)
+        }
+        if BROTLI_AVAILABLE:
+            self.encodings['br'] = brotli.compress(raw, quality=9)
+
+    def negotiate(self, accept_encodings) -> str:
+        """Pick the smallest coding the client accepts (werkzeug Accept object)"""
+        for coding in ('br', 'gzip'):
+            if coding in self.encodings and accept_encodings.quality(coding) > 0:
+                return coding
+        return 'identity'
+
+    def response(self, coding: str) -> Response:
+        response = Response(self.encodings[coding], mimetype='application/json')
+        if coding != 'identity':
+            response.headers['Content-Encoding'] = coding
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+
+class ResponseCache:
+    """Per-worker cache of final response bodies, rebuilt only when their source changes.
+
+    Each entry is tagged with a version string (e.g. the feed ETag); a lookup
+    with a different tag rebuilds the entry, so hot requests cost a dict
+    lookup and no serialization or compression.
+    """
+
+    def __init__(self, max_entries: int = 256, metrics: Optional[Metrics] = None):
+        self.bodies = TTLCache(max_entries=max_entries, ttl=None)
+        self.metrics = metrics or NullMetrics()
+
+    def get(self, key: Hashable, tag: str, build_payload: Callable[[], Dict]) -> EncodedBody:
+        entry = self.bodies.get(key)
+        if entry is not None and entry[0] == tag:
+            self.metrics.inc('cache_requests_total', {'cache': 'response', 'result': 'hit'})
+            return entry[1]
+        self.metrics.inc('cache_requests_total', {'cache': 'response', 'result': 'miss'})
+        with self.metrics.timer('serialize'):
+            body = EncodedBody(dumps(build_payload()))
+        self.bodies.set(key, (tag, body))
+        return body
@@ -0,0 +1,157 @@
+import json
+import re
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+from sqlite_store import SQLiteStore
+
+
+class ArticleIndex(SQLiteStore):
+    """Local full-text index of processed articles (SQLite FTS5).
+
+    Title, description, summary and source are indexed; the processed article
+    itself is kept alongside so results need no upstream call. If the SQLite
+    build lacks FTS5, ``available`` is False and searches return nothing.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS indexed_articles (
+            url TEXT PRIMARY KEY,
+            category TEXT,
+            source TEXT,
+            published_at TEXT,
+            indexed_at REAL NOT NULL,
+            payload TEXT NOT NULL
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_indexed_articles_published ON indexed_articles (published_at)',
+    )
+
+    FTS_SCHEMA = (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+        "title, description, summary, source, tokenize='porter unicode61')"
+    )
+
+    # bm25 column weights: title, description, summary, source; stored as the table's ``rank``
+    RANK = 'bm25(10.0, 4.0, 2.0, 1.0)'
+
+    def __init__(self, path: str, max_candidates: int = 1000):
+        super().__init__(path)
+        self.max_candidates = max_candidates
+        try:
+            self.conn.execute(self.FTS_SCHEMA)
+            self.conn.execute("INSERT INTO articles_fts (articles_fts, rank) VALUES ('rank', ?)", (self.RANK,))
+            self.available = True
+        except sqlite3.OperationalError as e:
+            print(f"⚠ SQLite FTS5 not available - local search disabled ({e})")
+            self.available = False
+
+    def add_articles(self, articles: List[Dict], category: Optional[str] = None):
+        """Insert or update processed articles in one transaction"""
+        if not self.available:
+            return
+        conn = self.conn
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for article in articles:
+                url = article.get('url')
+                if not url:
+                    continue
+                row = conn.execute(
+                    'SELECT rowid, category FROM indexed_articles WHERE url = ?', (url,)
+                ).fetchone()
+                values = (
+                    category or (row[1] if row else None),
+                    article.get('source'),
+                    article.get('publishedAt'),
+                    now,
+                    json.dumps(article)
+                )
+                if row is None:
+                    rowid = conn.execute(
+                        'INSERT INTO indexed_articles (category, source, published_at, indexed_at, payload, url) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (*values, url)
+                    ).lastrowid
+                else:
+                    rowid = row[0]
+                    conn.execute(
+                        'UPDATE indexed_articles SET category = ?, source = ?, published_at = ?, indexed_at = ?, '
+                        'payload = ? WHERE url = ?',
+                        (*values, url)
+                    )
+                    conn.execute('DELETE FROM articles_fts WHERE rowid = ?', (rowid,))
+                conn.execute(
+                    'INSERT INTO articles_fts (rowid, title, description, summary, source) VALUES (?, ?, ?, ?, ?)',
+                    (rowid, article.get('title') or '', article.get('description') or '',
+                     article.get('summary') or '', article.get('source') or '')
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    @staticmethod
+    def to_match_query(query: str) -> Optional[str]:
+        """Turn free text into a safe FTS5 query in which every (stemmed) word must match
+
+        Prefix terms are avoided on purpose: they expand to every indexed token
+        sharing the prefix and make common queries several times slower.
+        """
+        words = re.findall(r'\w+', query or '')
+        if not words:
+            return None
+        return ' '.join(f'"{word}"' for word in words)
+
+    def search(self, query: str, category: Optional[str] = None, source: Optional[str] = None,
+               date_from: Optional[str] = None, date_to: Optional[str] = None,
+               page: int = 1, page_size: int = 20) -> Dict:
+        """Ranked, paginated search; returns {'articles': [...], 'total': n, 'more': bool}
+
+        Only the ``max_candidates`` most recently indexed matches are ranked,
+        so common terms cost the same as rare ones; ``total`` is capped at
+        that many and ``more`` says whether older matches were left out.
+        """
+        match = self.to_match_query(query)
+        if not self.available or match is None:
+            return {'articles': [], 'total': 0, 'more': False}
+
+        where = ['articles_fts MATCH ?']
+        params = [match]
+        if category:
+            where.append('a.category = ?')
+            params.append(category.lower())
+        if source:
+            where.append('a.source = ?')
+            params.append(source)
+        if date_from:
+            where.append('a.published_at >= ?')
+            params.append(date_from)
+        if date_to:
+            # Dates without a time include the whole day
+            where.append('a.published_at <= ?')
+            params.append(date_to + 'T23:59:59Z' if len(date_to) == 10 else date_to)
+        clause = ' AND '.join(where)
+        # Metadata is only joined when a filter needs it; payloads only for the returned page
+        source_table = 'articles_fts' if len(where) == 1 else (
+            'articles_fts JOIN indexed_articles a ON a.rowid = articles_fts.rowid'
+        )
+        candidates = (
+            f'SELECT articles_fts.rowid AS id, articles_fts.rank AS score FROM {source_table} '
+            f'WHERE {clause} ORDER BY articles_fts.rowid DESC LIMIT ?'
+        )
+
+        matched = self.conn.execute(
+            f'SELECT COUNT(*) FROM ({candidates})', (*params, self.max_candidates + 1)
+        ).fetchone()[0]
+        rows = self.conn.execute(
+            f'SELECT a.payload FROM ({candidates}) c JOIN indexed_articles a ON a.rowid = c.id '
+            f'ORDER BY c.score LIMIT ? OFFSET ?',
+            (*params, self.max_candidates, page_size, (page - 1) * page_size)
+        ).fetchall()
+        return {
+            'articles': [json.loads(row[0]) for row in rows],
+            'total': min(matched, self.max_candidates),
+            'more': matched > self.max_candidates
+        }
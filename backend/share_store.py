@@ -0,0 +1,139 @@
+import json
+from abc import ABC, abstractmethod
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlite_store import SQLiteStore
+
+
+class ShareStore(ABC):
+    """Storage interface for shared articles.
+
+    Records look like ``{'article': ..., 'created_at': <iso>, 'views': <int>}``.
+    Entries expire ``ttl`` seconds after creation and the oldest entries are
+    dropped beyond ``max_entries``.
+    """
+
+    def __init__(self, ttl: float = 30 * 24 * 3600, max_entries: int = 100000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def create(self, share_id: str, article: Dict) -> Dict:
+        """Store a new share and return its record"""
+
+    @abstractmethod
+    def view(self, share_id: str) -> Optional[Dict]:
+        """Atomically increment the view count and return the record, or None"""
+
+
+class MemoryShareStore(ShareStore):
+    """Per-process store, for local development and single-worker setups"""
+
+    def __init__(self, ttl: float = 30 * 24 * 3600, max_entries: int = 100000):
+        super().__init__(ttl, max_entries)
+        self._records = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, share_id: str, article: Dict) -> Dict:
+        record = {'article': article, 'created_at': datetime.now().isoformat(), 'views': 0}
+        with self._lock:
+            self._records[share_id] = (record, time.time() + self.ttl)
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+        return dict(record)
+
+    def view(self, share_id: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._records.get(share_id)
+            if entry is None:
+                return None
+            record, expires_at = entry
+            if expires_at <= time.time():
+                del self._records[share_id]
+                return None
+            record['views'] += 1
+            return dict(record)
+
+
+class SQLiteShareStore(ShareStore, SQLiteStore):
+    """Shared-article store in a WAL-mode SQLite file, shared by all workers"""
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS shared_articles (
+            share_id TEXT PRIMARY KEY,
+            article TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            views INTEGER NOT NULL DEFAULT 0
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_shared_articles_expires ON shared_articles (expires_at)',
+    )
+
+    # Purge expired and surplus rows after this many inserts
+    PURGE_EVERY = 100
+
+    def __init__(self, path: str, ttl: float = 30 * 24 * 3600, max_entries: int = 100000):
+        ShareStore.__init__(self, ttl, max_entries)
+        SQLiteStore.__init__(self, path)
+        self._inserts = 0
+        self._counter_lock = threading.Lock()
+
+    def create(self, share_id: str, article: Dict) -> Dict:
+        record = {'article': article, 'created_at': datetime.now().isoformat(), 'views': 0}
+        self.conn.execute(
+            'INSERT OR REPLACE INTO shared_articles (share_id, article, created_at, expires_at, views) '
+            'VALUES (?, ?, ?, ?, 0)',
+            (share_id, json.dumps(article), record['created_at'], time.time() + self.ttl)
+        )
+        with self._counter_lock:
+            self._inserts += 1
+            purge = self._inserts % self.PURGE_EVERY == 0
+        if purge:
+            self.purge()
+        return record
+
+    def view(self, share_id: str) -> Optional[Dict]:
+        conn = self.conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                'UPDATE shared_articles SET views = views + 1 WHERE share_id = ? AND expires_at > ?',
+                (share_id, time.time())
+            )
+            row = conn.execute(
+                'SELECT article, created_at, views, expires_at FROM shared_articles WHERE share_id = ?',
+                (share_id,)
+            ).fetchone()
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if row is None or row[3] <= time.time():
+            return None
+        return {'article': json.loads(row[0]), 'created_at': row[1], 'views': row[2]}
+
+    def purge(self):
+        """Delete expired rows, then the oldest rows beyond max_entries"""
+        try:
+            self.conn.execute('DELETE FROM shared_articles WHERE expires_at <= ?', (time.time(),))
+            self.conn.execute(
+                '''DELETE FROM shared_articles WHERE share_id IN (
+                    SELECT share_id FROM shared_articles ORDER BY expires_at DESC LIMIT -1 OFFSET ?
+                )''',
+                (self.max_entries,)
+            )
+        except Exception as e:
+            print(f"Share store purge error: {e}")
+
+
+def create_share_store(backend: str, path: str, ttl: float, max_entries: int) -> ShareStore:
+    """Build the configured share store backend ('sqlite' or 'memory')"""
+    if backend == 'memory':
+        return MemoryShareStore(ttl=ttl, max_entries=max_entries)
+    if backend == 'sqlite':
+        return SQLiteShareStore(path, ttl=ttl, max_entries=max_entries)
+    raise ValueError(f"Unknown share store backend: {backend}")
@@ -0,0 +1,266 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlite_store import SQLiteStore
+
+
+class LeaseStore(SQLiteStore):
+    """Expiring, named leases shared by all workers.
+
+    A lease marks one process as the owner of an in-flight computation; it
+    expires on its own if the owner dies before releasing it.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS leases (
+            key TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )''',
+    )
+
+    @staticmethod
+    def owner_id() -> str:
+        return f"{os.getpid()}:{threading.get_ident()}"
+
+    def acquire(self, key: str, ttl: float) -> bool:
+        conn = self.conn
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT owner, expires_at FROM leases WHERE key = ?', (key,)).fetchone()
+            if row is not None and row[1] > now and row[0] != self.owner_id():
+                conn.execute('COMMIT')
+                return False
+            conn.execute(
+                'INSERT OR REPLACE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)',
+                (key, self.owner_id(), now + ttl)
+            )
+            conn.execute('COMMIT')
+            return True
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def release(self, key: str):
+        self.conn.execute('DELETE FROM leases WHERE key = ? AND owner = ?', (key, self.owner_id()))
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent computations of the same key.
+
+    Within a process, callers that arrive while a key is in flight wait for
+    the first caller's result. With a LeaseStore, the first caller in each
+    process also takes a cross-process lease; if another worker holds it, the
+    caller polls ``check`` (typically a shared-cache read) until that worker's
+    result shows up, and only computes itself if the lease frees up or
+    ``wait_timeout`` passes.
+    """
+
+    def __init__(self, leases: Optional[LeaseStore] = None, lease_ttl: float = 120,
+                 wait_timeout: float = 60, poll_interval: float = 0.2):
+        self.leases = leases
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any], check: Optional[Callable[[], Any]] = None,
+           timeout: Optional[float] = None, accept: Optional[Callable[[Any], bool]] = None,
+           on_timeout: Optional[Callable[[], Any]] = None) -> Any:
+        """Run ``fn`` for ``key``, or wait for the caller already running it
+
+        ``timeout`` bounds how long this caller waits on others (in this
+        process or another worker); after that it returns ``on_timeout()``,
+        or runs ``fn`` itself when no ``on_timeout`` is given. A result from
+        another caller that ``accept`` rejects is not used, and ``fn`` runs.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.event.wait(timeout):
+                return fn() if on_timeout is None else on_timeout()
+            if call.error is not None:
+                raise call.error
+            if accept is None or accept(call.result):
+                return call.result
+            return fn()
+
+        try:
+            call.result = self._run(key, fn, check, timeout, on_timeout)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def do_many(self, keys: List[str], fn: Callable[[List[str]], Dict[str, Any]],
+                check: Optional[Callable[[str], Any]] = None, timeout: Optional[float] = None,
+                accept: Optional[Callable[[Any], bool]] = None,
+                on_timeout: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+        """Coalesce a batch: ``fn(keys)`` computes only the keys nobody else is computing
+
+        ``fn`` must return a result for every key it is given. Keys in flight
+        in this process are awaited; keys leased by another worker are polled
+        with ``check(key)`` and computed here if they have not shown up within
+        ``wait_timeout``. Own keys are finished before waiting on anyone else,
+        so overlapping batches cannot deadlock. ``timeout``, ``accept`` and
+        ``on_timeout`` (called per key) work as in ``do``.
+        """
+        gives_up_at = None if timeout is None else time.monotonic() + timeout
+        keys = list(dict.fromkeys(keys))
+        owned = []
+        waiting = {}
+        with self._lock:
+            for key in keys:
+                call = self._calls.get(key)
+                if call is None:
+                    self._calls[key] = _Call()
+                    owned.append(key)
+                else:
+                    waiting[key] = call
+                    self.coalesced += 1
+
+        leased = owned
+        elsewhere = []
+        if self.leases is not None:
+            leased = []
+            for key in owned:
+                try:
+                    acquired = self.leases.acquire(key, self.lease_ttl)
+                except Exception as e:
+                    print(f"Lease store error: {e}")
+                    acquired = True
+                (leased if acquired else elsewhere).append(key)
+
+        results = {}
+        error = None
+        try:
+            if leased:
+                results.update(fn(leased))
+            if elsewhere:
+                results.update(self._poll_many(elsewhere, fn, check, gives_up_at, on_timeout))
+        except Exception as e:
+            error = e
+        finally:
+            for key in leased:
+                if self.leases is not None:
+                    try:
+                        self.leases.release(key)
+                    except Exception as e:
+                        print(f"Lease store error: {e}")
+            with self._lock:
+                calls = [self._calls.pop(key) for key in owned]
+            for key, call in zip(owned, calls):
+                call.result = results.get(key)
+                call.error = error
+                call.event.set()
+        if error is not None:
+            raise error
+
+        redo = []
+        for key, call in waiting.items():
+            if not call.event.wait(None if gives_up_at is None else max(0.0, gives_up_at - time.monotonic())):
+                if on_timeout is not None:
+                    results[key] = on_timeout(key)
+                else:
+                    redo.append(key)
+                continue
+            if call.error is not None:
+                raise call.error
+            if accept is None or accept(call.result):
+                results[key] = call.result
+            else:
+                redo.append(key)
+        if redo:
+            results.update(fn(redo))
+        return results
+
+    def _poll_many(self, keys: List[str], fn: Callable[[List[str]], Dict[str, Any]],
+                   check: Optional[Callable[[str], Any]], gives_up_at: Optional[float] = None,
+                   on_timeout: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+        """Wait for keys another worker is computing; compute whatever has not appeared in time
+
+        Past ``gives_up_at`` (the caller's own timeout) keys that have not
+        appeared get ``on_timeout(key)`` instead, when it is given.
+        """
+        results = {}
+        deadline = time.monotonic() + self.wait_timeout
+        gives_up = gives_up_at is not None and gives_up_at < deadline and on_timeout is not None
+        if gives_up:
+            deadline = gives_up_at
+        remaining = list(keys)
+        while remaining and check is not None and time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            for key in list(remaining):
+                result = check(key)
+                if result is not None:
+                    results[key] = result
+                    remaining.remove(key)
+        if remaining:
+            if gives_up:
+                results.update({key: on_timeout(key) for key in remaining})
+            else:
+                results.update(fn(remaining))
+        return results
+
+    def _run(self, key: str, fn: Callable[[], Any], check: Optional[Callable[[], Any]],
+             timeout: Optional[float] = None, on_timeout: Optional[Callable[[], Any]] = None) -> Any:
+        if self.leases is None:
+            return fn()
+
+        # Past wait_timeout the lease holder is presumed stuck and we compute; past the
+        # caller's own timeout we give up waiting and return on_timeout() if there is one
+        gives_up = timeout is not None and timeout < self.wait_timeout and on_timeout is not None
+        deadline = time.monotonic() + (self.wait_timeout if timeout is None else min(timeout, self.wait_timeout))
+        waited = False
+        while True:
+            try:
+                acquired = self.leases.acquire(key, self.lease_ttl)
+            except Exception as e:
+                print(f"Lease store error: {e}")
+                return fn()
+
+            if acquired:
+                try:
+                    # Another worker may have finished while we were waiting
+                    if waited and check is not None:
+                        result = check()
+                        if result is not None:
+                            return result
+                    return fn()
+                finally:
+                    try:
+                        self.leases.release(key)
+                    except Exception as e:
+                        print(f"Lease store error: {e}")
+
+            if check is not None:
+                result = check()
+                if result is not None:
+                    return result
+            if time.monotonic() >= deadline:
+                return on_timeout() if gives_up else fn()
+            waited = True
+            time.sleep(self.poll_interval)
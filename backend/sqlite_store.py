@@ -0,0 +1,37 @@
+import os
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+    """Base class for small on-disk stores shared between gunicorn workers.
+
+    Each thread gets its own connection to the same database file. WAL mode
+    lets readers in every worker proceed while one writer commits.
+    Subclasses set ``SCHEMA`` to the statements that create their tables.
+    """
+
+    SCHEMA = ()
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        with conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._connect()
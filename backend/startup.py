@@ -0,0 +1,28 @@
+import time
+from typing import Dict, Optional
+
+
+class StartupReport:
+    """Wall-clock cost of each boot phase, in milliseconds"""
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self._last = self.started
+        self.phases = {}
+
+    def mark(self, phase: str):
+        """Record the time since the previous mark under ``phase``"""
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 1)
+        self._last = now
+
+    @property
+    def total_ms(self) -> float:
+        return round((self._last - self.started) * 1000, 1)
+
+    def as_dict(self) -> Dict:
+        return {'totalMs': self.total_ms, 'phases': dict(self.phases)}
+
+    def summary(self) -> str:
+        phases = ', '.join(f"{phase} {ms}ms" for phase, ms in self.phases.items())
+        return f"Startup completed in {self.total_ms}ms ({phases})"
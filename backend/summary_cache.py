@@ -0,0 +1,117 @@
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from cache import TTLCache
+from sqlite_store import SQLiteStore
+
+
+class SummaryCache(SQLiteStore):
+    """Content-addressed store for generated article summaries.
+
+    Summaries are keyed by a hash of the model, prompt version and article
+    text, so an edited article or a new prompt never reuses a stale summary.
+    An in-memory LRU sits in front of the SQLite file, which is shared by all
+    workers and survives restarts.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS summaries (
+            key TEXT PRIMARY KEY,
+            summary TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries (accessed_at)',
+    )
+
+    # Trim the table back under max_entries after this many inserts
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int = 50000, memory_entries: int = 1000):
+        super().__init__(path)
+        self.max_entries = max_entries
+        self.memory = TTLCache(max_entries=memory_entries, ttl=None)
+        self._counter_lock = threading.Lock()
+        self._inserts = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model_name: str, prompt_version: str, title: str, description: str, content: str) -> str:
+        digest = hashlib.sha256()
+        for part in (model_name, prompt_version, title, description, content):
+            digest.update((part or '').encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        summary = self.memory.get(key)
+        if summary is not None:
+            with self._counter_lock:
+                self.memory_hits += 1
+            return summary
+
+        try:
+            row = self.conn.execute('SELECT summary FROM summaries WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self.conn.execute('UPDATE summaries SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        except Exception as e:
+            print(f"Summary cache read error: {e}")
+            row = None
+
+        with self._counter_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+        if row is None:
+            return None
+        self.memory.set(key, row[0])
+        return row[0]
+
+    def set(self, key: str, summary: str):
+        self.memory.set(key, summary)
+        now = time.time()
+        try:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO summaries (key, summary, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, summary, now, now)
+            )
+        except Exception as e:
+            print(f"Summary cache write error: {e}")
+            return
+
+        with self._counter_lock:
+            self._inserts += 1
+            evict = self._inserts % self.EVICT_EVERY == 0
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """Drop least recently used rows beyond max_entries"""
+        try:
+            self.conn.execute(
+                '''DELETE FROM summaries WHERE key IN (
+                    SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )''',
+                (self.max_entries,)
+            )
+        except Exception as e:
+            print(f"Summary cache eviction error: {e}")
+
+    def stats(self) -> dict:
+        try:
+            entries = self.conn.execute('SELECT COUNT(*) FROM summaries').fetchone()[0]
+        except Exception:
+            entries = None
+        return {
+            'entries': entries,
+            'maxEntries': self.max_entries,
+            'memoryEntries': len(self.memory),
+            'memoryHits': self.memory_hits,
+            'diskHits': self.disk_hits,
+            'misses': self.misses
+        }
@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import requests
+
+from circuit_breaker import CircuitBreaker
+from dedup import DuplicateIndex
+from deadline import Deadline
+from http_client import HttpClient
+from news_service import LLMSummary, NewsService
+from summary_cache import SummaryCache
+
+
+class TimingOutHttpClient(HttpClient):
+    """Every GET waits out its read timeout, then fails like an unresponsive upstream"""
+
+    def __init__(self, read_timeout: float = 0.2):
+        super().__init__(read_timeout=read_timeout)
+        self.calls = 0
+
+    def get(self, url, params=None, retry=True, **kwargs):
+        self.calls += 1
+        timeout = kwargs.get('timeout', self.timeout)
+        time.sleep(timeout[1])
+        raise requests.exceptions.ReadTimeout(f"Read timed out. (read timeout={timeout[1]})")
+
+
+class NewsApiBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.breaker = CircuitBreaker(os.path.join(self.directory, 'breakers.db'), 'newsapi', failure_threshold=1)
+        self.http = TimingOutHttpClient()
+        self.service = NewsService('test-key', None, http_client=self.http, breakers={'newsapi': self.breaker})
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_timeout_cut_short_by_deadline_is_not_a_failure(self):
+        for _ in range(3):
+            news_data = self.service._fetch_news_upstream(category='general', deadline=Deadline(0.02))
+            self.assertEqual(news_data['status'], 'error')
+        self.assertEqual(self.http.calls, 3)
+        self.assertEqual(self.breaker.stats()['state'], 'closed')
+        self.assertEqual(self.breaker.stats()['consecutiveFailures'], 0)
+
+    def test_spent_deadline_skips_the_call(self):
+        deadline = Deadline(0)
+        news_data = self.service._fetch_news_upstream(category='general', deadline=deadline)
+        self.assertEqual(news_data['status'], 'error')
+        self.assertEqual(self.http.calls, 0)
+
+    def test_timeout_at_configured_limit_opens_breaker(self):
+        news_data = self.service._fetch_news_upstream(category='general')
+        self.assertEqual(news_data['status'], 'error')
+        self.assertEqual(self.breaker.stats()['state'], 'open')
+
+    def test_timeout_with_budget_to_spare_opens_breaker(self):
+        self.service._fetch_news_upstream(category='general', deadline=Deadline(5))
+        self.assertEqual(self.breaker.stats()['state'], 'open')
+
+
+class FakeGeminiModel:
+    model_name = 'fake-gemini'
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("500 Internal error")
+        return type('Response', (), {'text': 'Gemini summary.'})()
+
+
+def wire_story(url: str, source: str) -> dict:
+    return {
+        'title': 'Central bank raises interest rates by a quarter point to curb inflation',
+        'description': 'The central bank raised its benchmark interest rate by a quarter point on Tuesday, '
+                       'citing persistent inflation and a strong labour market.',
+        'content': f'{source} reports that policymakers voted to raise rates again.',
+        'url': url,
+        'source': {'name': source},
+        'publishedAt': '2026-01-01T00:00:00Z'
+    }
+
+
+class ClusterSummaryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = SummaryCache(os.path.join(self.directory, 'summaries.db'))
+        self.articles = [wire_story('https://a.example/1', 'Wire A'), wire_story('https://b.example/1', 'Wire B')]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def service(self, model: FakeGeminiModel, summary_tier: str = 'llm') -> NewsService:
+        service = NewsService(
+            'test-key', None, summary_cache=self.cache, duplicate_index=DuplicateIndex(), summary_tier=summary_tier
+        )
+        service.gemini_model = model
+        return service
+
+    def cached(self, service: NewsService, article: dict):
+        return self.cache.get(service._summary_cache_key(
+            article['title'], article['description'], article['content']
+        ))
+
+    def test_clusters_share_gemini_summary(self):
+        service = self.service(FakeGeminiModel())
+        processed = service.process_news_data({'articles': self.articles}, record=False)['articles']
+        self.assertEqual(processed[0]['clusterId'], processed[1]['clusterId'])
+        self.assertEqual([article['summary'] for article in processed], ['Gemini summary.'] * 2)
+        self.assertEqual(service.gemini_model.calls, 1)
+        self.assertEqual(self.cached(service, self.articles[1]), 'Gemini summary.')
+
+    def test_fallback_summary_is_not_shared_or_cached(self):
+        service = self.service(FakeGeminiModel(fail=True))
+        processed = service.process_news_data({'articles': self.articles}, record=False)['articles']
+        follower = self.articles[1]
+        self.assertEqual(processed[1]['summary'], service._fallback_summary(
+            follower['title'], follower['description'], follower['content']
+        ))
+        self.assertIsNone(self.cached(service, self.articles[0]))
+        self.assertIsNone(self.cached(service, follower))
+
+    def test_local_then_llm_does_not_cache_shared_summary(self):
+        service = self.service(FakeGeminiModel(), summary_tier='local_then_llm')
+        service._upgrade_summaries_async = lambda articles: None
+        cluster_id = service._cluster_articles(self.articles[:1])[0]
+        service._remember_cluster_summary(cluster_id, {'summary': LLMSummary('Remembered Gemini summary.')})
+        processed = service.process_news_data({'articles': self.articles[1:]}, record=False)['articles']
+        self.assertEqual(processed[0]['summary'], 'Remembered Gemini summary.')
+        self.assertIsNone(self.cached(service, self.articles[1]))
+
+    def test_local_summary_is_not_shared(self):
+        service = self.service(FakeGeminiModel(), summary_tier='local')
+        processed = service.process_news_data({'articles': self.articles}, record=False)['articles']
+        follower = self.articles[1]
+        self.assertEqual(processed[1]['summary'], service._fallback_summary(
+            follower['title'], follower['description'], follower['content']
+        ))
+        self.assertEqual(service.gemini_model.calls, 0)
+        self.assertIsNone(self.cached(service, follower))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import hashlib
+import threading
+import time
+from typing import Dict, List
+
+from cache import TTLCache
+from sqlite_store import SQLiteStore
+
+
+class TranslationCache(SQLiteStore):
+    """Translations keyed by (text hash, source, target), shared by all workers.
+
+    An in-memory LRU with the same TTL sits in front of the SQLite file.
+    """
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS translations (
+            key TEXT PRIMARY KEY,
+            translation TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_translations_expires ON translations (expires_at)',
+    )
+
+    # Purge expired and surplus rows after this many inserts
+    PURGE_EVERY = 500
+
+    # SQLite's default limit on bound parameters is 999
+    QUERY_CHUNK = 500
+
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 200000,
+                 memory_entries: int = 5000):
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory = TTLCache(max_entries=memory_entries, ttl=ttl)
+        self._counter_lock = threading.Lock()
+        self._inserts = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(text: str, source: str, target: str) -> str:
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"{source or 'auto'}:{target}:{digest}"
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        found = {}
+        missing = []
+        for key in keys:
+            translation = self.memory.get(key)
+            if translation is None:
+                missing.append(key)
+            else:
+                found[key] = translation
+
+        now = time.time()
+        for start in range(0, len(missing), self.QUERY_CHUNK):
+            chunk = missing[start:start + self.QUERY_CHUNK]
+            try:
+                rows = self.conn.execute(
+                    f"SELECT key, translation FROM translations WHERE expires_at > ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    (now, *chunk)
+                ).fetchall()
+            except Exception as e:
+                print(f"Translation cache read error: {e}")
+                continue
+            for key, translation in rows:
+                found[key] = translation
+                self.memory.set(key, translation)
+
+        with self._counter_lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, translations: Dict[str, str]):
+        if not translations:
+            return
+        expires_at = time.time() + self.ttl
+        for key, translation in translations.items():
+            self.memory.set(key, translation)
+        try:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO translations (key, translation, expires_at) VALUES (?, ?, ?)',
+                [(key, translation, expires_at) for key, translation in translations.items()]
+            )
+        except Exception as e:
+            print(f"Translation cache write error: {e}")
+            return
+
+        with self._counter_lock:
+            before = self._inserts
+            self._inserts += len(translations)
+            purge = before // self.PURGE_EVERY != self._inserts // self.PURGE_EVERY
+        if purge:
+            self.purge()
+
+    def purge(self):
+        """Delete expired rows, then the soonest-expiring rows beyond max_entries"""
+        try:
+            self.conn.execute('DELETE FROM translations WHERE expires_at <= ?', (time.time(),))
+            self.conn.execute(
+                '''DELETE FROM translations WHERE key IN (
+                    SELECT key FROM translations ORDER BY expires_at DESC LIMIT -1 OFFSET ?
+                )''',
+                (self.max_entries,)
+            )
+        except Exception as e:
+            print(f"Translation cache purge error: {e}")
+
+    def stats(self) -> dict:
+        return {
+            'memoryEntries': len(self.memory),
+            'hits': self.hits,
+            'misses': self.misses
+        }